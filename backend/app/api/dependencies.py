@@ -21,28 +21,35 @@ from app.services.feed_monitor import FeedMonitor
 from app.services.health import HealthMonitor
 from app.services.kill_switch import KillSwitch
 from app.services.llm import LLMService
+from app.services.mission import MissionService
 from app.services.notifications import NotificationService
+from app.services.prompt_builder import PromptBuilder
 from app.services.scheduler import Scheduler
 from app.services.strategy import StrategyEngine
 from app.services.translation import TranslationService
 
 
-def get_config(request: Request) -> Config:
+# Providers are plain attribute lookups declared ``async def`` so FastAPI
+# resolves them on the event loop instead of sending each one to its
+# threadpool.
+
+
+async def get_config(request: Request) -> Config:
     """Provide the application ``Config`` instance."""
     return request.app.state.config
 
 
-def get_db(request: Request) -> Database:
+async def get_db(request: Request) -> Database:
     """Provide the ``Database`` singleton."""
     return request.app.state.db
 
 
-def get_auth_service(request: Request) -> AuthService:
+async def get_auth_service(request: Request) -> AuthService:
     """Provide the ``AuthService`` instance."""
     return request.app.state.auth_service
 
 
-def get_current_session(request: Request) -> Session:
+async def get_current_session(request: Request) -> Session:
     """Return the authenticated ``Session`` or raise 401.
 
     Relies on ``AuthMiddleware`` having populated ``request.state.session``.
@@ -53,7 +60,7 @@ def get_current_session(request: Request) -> Session:
     return session
 
 
-def get_security_filter(request: Request) -> SecurityFilter:
+async def get_security_filter(request: Request) -> SecurityFilter:
     """Provide the ``SecurityFilter`` instance."""
     return request.app.state.security_filter
 
@@ -63,29 +70,29 @@ def get_security_filter(request: Request) -> SecurityFilter:
 # ------------------------------------------------------------------
 
 
-def get_conversation_repo(request: Request) -> ConversationRepository:
-    """Provide a ``ConversationRepository`` backed by the app DB."""
-    return ConversationRepository(request.app.state.db)
+async def get_conversation_repo(request: Request) -> ConversationRepository:
+    """Provide the shared ``ConversationRepository`` instance."""
+    return request.app.state.conversation_repo
 
 
-def get_activity_repo(request: Request) -> ActivityRepository:
-    """Provide an ``ActivityRepository`` backed by the app DB."""
-    return ActivityRepository(request.app.state.db)
+async def get_activity_repo(request: Request) -> ActivityRepository:
+    """Provide the shared ``ActivityRepository`` instance."""
+    return request.app.state.activity_repo
 
 
-def get_notification_repo(request: Request) -> NotificationRepository:
-    """Provide a ``NotificationRepository`` backed by the app DB."""
-    return NotificationRepository(request.app.state.db)
+async def get_notification_repo(request: Request) -> NotificationRepository:
+    """Provide the shared ``NotificationRepository`` instance."""
+    return request.app.state.notification_repo
 
 
-def get_collected_info_repo(request: Request) -> CollectedInfoRepository:
-    """Provide a ``CollectedInfoRepository`` backed by the app DB."""
-    return CollectedInfoRepository(request.app.state.db)
+async def get_collected_info_repo(request: Request) -> CollectedInfoRepository:
+    """Provide the shared ``CollectedInfoRepository`` instance."""
+    return request.app.state.collected_info_repo
 
 
-def get_settings_repo(request: Request) -> SettingsRepository:
-    """Provide a ``SettingsRepository`` backed by the app DB."""
-    return SettingsRepository(request.app.state.db)
+async def get_settings_repo(request: Request) -> SettingsRepository:
+    """Provide the shared ``SettingsRepository`` instance."""
+    return request.app.state.settings_repo
 
 
 # ------------------------------------------------------------------
@@ -93,7 +100,7 @@ def get_settings_repo(request: Request) -> SettingsRepository:
 # ------------------------------------------------------------------
 
 
-def get_platform_registry(request: Request) -> PlatformRegistry:
+async def get_platform_registry(request: Request) -> PlatformRegistry:
     """Provide the ``PlatformRegistry`` instance."""
     return request.app.state.platform_registry
 
@@ -103,17 +110,17 @@ def get_platform_registry(request: Request) -> PlatformRegistry:
 # ------------------------------------------------------------------
 
 
-def get_llm_service(request: Request) -> LLMService:
+async def get_llm_service(request: Request) -> LLMService:
     """Provide the ``LLMService`` instance."""
     return request.app.state.llm_service
 
 
-def get_strategy_engine(request: Request) -> StrategyEngine:
+async def get_strategy_engine(request: Request) -> StrategyEngine:
     """Provide the ``StrategyEngine`` instance."""
     return request.app.state.strategy_engine
 
 
-def get_translation_service(request: Request) -> TranslationService:
+async def get_translation_service(request: Request) -> TranslationService:
     """Provide the ``TranslationService`` instance."""
     return request.app.state.translation_service
 
@@ -123,12 +130,12 @@ def get_translation_service(request: Request) -> TranslationService:
 # ------------------------------------------------------------------
 
 
-def get_event_bus(request: Request) -> EventBus:
+async def get_event_bus(request: Request) -> EventBus:
     """Provide the ``EventBus`` singleton."""
     return request.app.state.event_bus
 
 
-def get_ws_manager(request: Request) -> WebSocketManager:
+async def get_ws_manager(request: Request) -> WebSocketManager:
     """Provide the ``WebSocketManager`` singleton."""
     return request.app.state.ws_manager
 
@@ -138,41 +145,46 @@ def get_ws_manager(request: Request) -> WebSocketManager:
 # ------------------------------------------------------------------
 
 
-def get_feed_monitor(request: Request) -> FeedMonitor:
+async def get_feed_monitor(request: Request) -> FeedMonitor:
     """Provide the ``FeedMonitor`` instance."""
     return request.app.state.feed_monitor
 
 
-def get_notification_service(request: Request) -> NotificationService:
+async def get_notification_service(request: Request) -> NotificationService:
     """Provide the ``NotificationService`` instance."""
     return request.app.state.notification_service
 
 
-def get_scheduler(request: Request) -> Scheduler:
+async def get_scheduler(request: Request) -> Scheduler:
     """Provide the ``Scheduler`` instance."""
     return request.app.state.scheduler
 
 
-def get_kill_switch(request: Request) -> KillSwitch:
+async def get_kill_switch(request: Request) -> KillSwitch:
     """Provide the ``KillSwitch`` instance."""
     return request.app.state.kill_switch
 
 
-def get_health_monitor(request: Request) -> HealthMonitor:
+async def get_health_monitor(request: Request) -> HealthMonitor:
     """Provide the ``HealthMonitor`` instance."""
     return request.app.state.health_monitor
 
 
-def get_backup_service(request: Request) -> BackupService:
+async def get_backup_service(request: Request) -> BackupService:
     """Provide the ``BackupService`` instance."""
     return request.app.state.backup_service
 
 
-def get_mission_service(request: Request):
-    """Provide the ``MissionService`` instance."""
-    return request.app.state.mission_service
+async def get_mission_service(request: Request) -> MissionService | None:
+    """Provide the ``MissionService`` instance, or None if not configured."""
+    return getattr(request.app.state, "mission_service", None)
+
+
+async def get_prompt_builder(request: Request) -> PromptBuilder | None:
+    """Provide the ``PromptBuilder`` instance, or None if not configured."""
+    return getattr(request.app.state, "prompt_builder", None)
 
 
-def get_memory_service(request: Request):
+async def get_memory_service(request: Request):
     """Provide the ``MemoryService`` instance."""
     return request.app.state.memory_service
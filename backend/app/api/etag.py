@@ -0,0 +1,48 @@
+"""ETag / ``If-None-Match`` helpers for cheap revalidation of polled GETs."""
+
+from __future__ import annotations
+
+import hashlib
+
+from starlette.requests import HTTPConnection
+from starlette.responses import Response
+
+# Revalidate on every use, but let the browser keep (and send back) the
+# ETag.  ``private`` keeps per-session responses out of shared caches.
+_CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(body: bytes) -> str:
+    """Return a strong, quoted ETag for *body*."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: HTTPConnection, etag: str) -> bool:
+    """Return True if the request's ``If-None-Match`` covers *etag*."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        # Weak comparison, as RFC 9110 prescribes for If-None-Match.
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def json_etag_response(
+    request: HTTPConnection,
+    body: bytes,
+    etag: str | None = None,
+) -> Response:
+    """Send pre-serialised JSON *body* with an ETag, or ``304`` if unchanged."""
+    if etag is None:
+        etag = compute_etag(body)
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -8,35 +8,37 @@ from app.api.middleware.ip_filter import IPFilterMiddleware
 from app.api.middleware.rate_limit import RateLimitMiddleware
 from app.api.middleware.request_log import RequestLoggingMiddleware
 from app.api.middleware.security_headers import SecurityHeadersMiddleware
+from app.api.middleware.unified import UnifiedSecurityMiddleware
 
+__all__ = [
+    "AuthMiddleware",
+    "CSRFMiddleware",
+    "IPFilterMiddleware",
+    "RateLimitMiddleware",
+    "RequestLoggingMiddleware",
+    "SecurityHeadersMiddleware",
+    "UnifiedSecurityMiddleware",
+    "register_middleware",
+]
 
-def register_middleware(app: FastAPI) -> None:
-    """Register all middleware on *app* in the correct order.
-
-    All middleware classes resolve their dependencies lazily from
-    ``request.app.state`` at request time, so this function can be called
-    during ``create_app`` before the lifespan context has run.
 
-    Starlette processes middleware in **reverse** registration order (last
-    added wraps outermost), so we register from innermost to outermost:
+def register_middleware(app: FastAPI) -> None:
+    """Register the custom middleware on *app*.
 
-        CSRF -> Auth -> RateLimit -> IPFilter -> RequestLogging -> SecurityHeaders -> CORS
+    All middleware resolves its dependencies lazily from ``app.state`` at
+    request time, so this function can be called during ``create_app``
+    before the lifespan context has run.
 
-    CORS is already added in ``create_app``, so we skip it here.  The
-    resulting onion is:
+    The individual middleware classes remain usable on their own, but only
+    ``UnifiedSecurityMiddleware`` is registered.  It runs the same checks in
+    straight-line code, in the order the old six-layer onion applied them:
 
-        CORS (outermost)
+        CORS (outermost, added in ``create_app``)
           -> SecurityHeaders
             -> RequestLogging
               -> IPFilter
                 -> RateLimit
                   -> Auth
-                    -> CSRF (innermost, validates after auth sets session)
+                    -> CSRF (validates after auth sets session)
     """
-    # Innermost first
-    app.add_middleware(CSRFMiddleware)
-    app.add_middleware(AuthMiddleware)
-    app.add_middleware(RateLimitMiddleware)
-    app.add_middleware(IPFilterMiddleware)
-    app.add_middleware(RequestLoggingMiddleware)
-    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(UnifiedSecurityMiddleware)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import TYPE_CHECKING
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Scope
 
+from app.api.middleware.base import CheckMiddleware, JSONErrorResponse
 from app.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from app.services.auth import AuthService
+
 logger = get_logger(__name__)
 
 # Paths that bypass authentication entirely.
@@ -26,8 +29,22 @@ _STATIC_PREFIXES: tuple[str, ...] = (
     "/favicon.ico",
 )
 
+_SESSION_COOKIE_PREFIX: bytes = b"session_token="
+
+_SERVICE_INITIALIZING = JSONErrorResponse.from_content(
+    503, {"detail": "Service initializing"}
+)
+_MISSING_TOKEN = JSONErrorResponse.from_content(401, {"detail": "Missing session token"})
+_INVALID_SESSION = JSONErrorResponse.from_content(
+    401, {"detail": "Invalid or expired session"}
+)
+
+# Exempt paths match exactly or as a parent segment ("/api/health/...").
+_EXEMPT_EXACT: frozenset[str] = frozenset(_EXEMPT_PREFIXES)
+_EXEMPT_SUBPATHS: tuple[str, ...] = tuple(p + "/" for p in _EXEMPT_PREFIXES)
 
-class AuthMiddleware(BaseHTTPMiddleware):
+
+class AuthMiddleware(CheckMiddleware):
     """Validates session tokens from cookies or Authorization header.
 
     Exempt paths (health, login, setup, docs, static assets) are passed
@@ -39,38 +56,45 @@ class AuthMiddleware(BaseHTTPMiddleware):
     A valid session is stored on ``request.state.session``.  Invalid or
     missing tokens receive a ``401`` JSON response.
 
-    The ``AuthService`` is resolved lazily from ``request.app.state`` so that
-    the middleware can be registered at app-creation time before the lifespan
-    context has initialised the service.
+    The ``AuthService`` is resolved from ``app.state`` on the first request
+    (and kept afterwards) so that the middleware can be registered at
+    app-creation time before the lifespan context has initialised it.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Response]) -> Response:
-        path = request.url.path
+    def __init__(self, app: ASGIApp) -> None:
+        super().__init__(app)
+        self._auth_service: AuthService | None = None
+
+    def check(self, scope: Scope) -> JSONErrorResponse | None:
+        """Authenticate an HTTP *scope*, returning an error response on failure.
 
+        On success the session is stored on the request state and ``None``
+        is returned.
+        """
         # Allow exempt paths
-        if self._is_exempt(path):
-            return await call_next(request)
+        if self._is_exempt(scope["path"]):
+            return None
 
-        # Lazy import of auth_service from app state
-        auth_service = getattr(request.app.state, "auth_service", None)
+        auth_service = self._auth_service
         if auth_service is None:
-            # Service not yet initialised (should not happen in normal flow)
-            return JSONResponse(
-                status_code=503,
-                content={"detail": "Service initializing"},
+            auth_service = self._auth_service = getattr(
+                scope["app"].state, "auth_service", None
             )
+        if auth_service is None:
+            # Service not yet initialised (should not happen in normal flow)
+            return _SERVICE_INITIALIZING
 
         # Extract token
-        token = self._extract_token(request)
+        token = self._extract_token(scope)
         if token is None:
-            return self._unauthorized("Missing session token")
+            return _MISSING_TOKEN
 
         session = auth_service.validate_session(token)
         if session is None:
-            return self._unauthorized("Invalid or expired session")
+            return _INVALID_SESSION
 
-        request.state.session = session
-        return await call_next(request)
+        Request(scope).state.session = session
+        return None
 
     # ------------------------------------------------------------------
     # Helpers
@@ -78,30 +102,32 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
     @staticmethod
     def _is_exempt(path: str) -> bool:
-        if path.startswith(_STATIC_PREFIXES):
-            return True
-        for prefix in _EXEMPT_PREFIXES:
-            if path == prefix or path.startswith(prefix + "/"):
-                return True
-        return False
+        return (
+            path.startswith(_STATIC_PREFIXES)
+            or path in _EXEMPT_EXACT
+            or path.startswith(_EXEMPT_SUBPATHS)
+        )
 
     @staticmethod
-    def _extract_token(request: Request) -> str | None:
-        # 1. Cookie
-        token = request.cookies.get("session_token")
-        if token:
-            return token
-
-        # 2. Authorization header
-        auth_header = request.headers.get("authorization", "")
-        if auth_header.lower().startswith("bearer "):
-            return auth_header[7:].strip()
-
+    def _extract_token(scope: Scope) -> str | None:
+        """Find the session token in one pass over the raw request headers.
+
+        The cookie wins over the ``Authorization`` header, matching the
+        order in the class docstring.  Only the ``session_token`` cookie is
+        located; the rest of the cookie header is never parsed.
+        """
+        bearer: bytes | None = None
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                for part in value.split(b";"):
+                    part = part.strip()
+                    if part.startswith(_SESSION_COOKIE_PREFIX):
+                        token = part[len(_SESSION_COOKIE_PREFIX):]
+                        if token:
+                            return token.decode("latin-1")
+            elif name == b"authorization" and value[:7].lower() == b"bearer ":
+                bearer = value[7:].strip()
+
+        if bearer is not None:
+            return bearer.decode("latin-1")
         return None
-
-    @staticmethod
-    def _unauthorized(detail: str) -> JSONResponse:
-        return JSONResponse(
-            status_code=401,
-            content={"detail": detail},
-        )
@@ -0,0 +1,99 @@
+"""Shared plumbing for middleware that can reject a request early."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Sequence
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+if TYPE_CHECKING:
+    from app.core.config import Config
+
+
+def encode_json(content: Any) -> bytes:
+    """Serialise *content* to compact UTF-8 JSON, as ``JSONResponse`` would."""
+    return orjson.dumps(content)
+
+
+class JSONErrorResponse:
+    """Minimal ASGI response carrying an already-serialised JSON body.
+
+    Rejections are sent straight through ``send`` without building a
+    Starlette ``Response``; constant bodies are created once at import time.
+    """
+
+    __slots__ = ("status_code", "body", "_headers")
+
+    def __init__(
+        self,
+        status_code: int,
+        body: bytes,
+        headers: Sequence[tuple[bytes, bytes]] = (),
+    ) -> None:
+        self.status_code = status_code
+        self.body = body
+        self._headers = (
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *headers,
+        )
+
+    @classmethod
+    def from_content(
+        cls,
+        status_code: int,
+        content: Any,
+        headers: Sequence[tuple[bytes, bytes]] = (),
+    ) -> JSONErrorResponse:
+        return cls(status_code, encode_json(content), headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Fresh header list per send: outer layers may append to it in place.
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": list(self._headers),
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+
+class CheckMiddleware:
+    """Base class for ASGI middleware built around a ``check`` method.
+
+    Subclasses implement :meth:`check`, which returns ``None`` to let the
+    request through or a response to send in place of the wrapped app.
+    The same ``check`` is reused by ``UnifiedSecurityMiddleware``.
+
+    ``Config`` lives on ``app.state`` and only exists once the lifespan has
+    run (Starlette finishes startup before serving requests), so it is
+    looked up on the first request and the reference kept afterwards.
+    Hot-reload replaces config *sections*, never the ``Config`` object, so
+    callers must still read ``config.web_security`` per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._config: Config | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response = self.check(scope)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    def check(self, scope: Scope) -> JSONErrorResponse | None:
+        raise NotImplementedError
+
+    def _resolve_config(self, scope: Scope) -> Config | None:
+        config = self._config
+        if config is None:
+            config = self._config = getattr(scope["app"].state, "config", None)
+        return config
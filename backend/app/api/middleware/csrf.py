@@ -1,16 +1,16 @@
-"""CSRF protection middleware using HMAC-based double-submit tokens."""
+"""CSRF protection middleware using keyed-hash double-submit tokens."""
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import hmac
 import time
-from typing import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.types import Scope
 
+from app.api.middleware.base import CheckMiddleware, JSONErrorResponse
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -25,44 +25,79 @@ _EXEMPT_PREFIXES: tuple[str, ...] = (
     "/ws/",
 )
 
+_TOKEN_MISSING = JSONErrorResponse.from_content(403, {"detail": "CSRF token missing"})
+_TOKEN_INVALID = JSONErrorResponse.from_content(
+    403, {"detail": "CSRF token invalid or expired"}
+)
+
 # Token validity window (seconds).
 _TOKEN_MAX_AGE: int = 3600  # 1 hour
 
+# Signature size in bytes (hex-encoded to 64 characters).
+_DIGEST_SIZE: int = 32
+_SIG_HEX_LENGTH: int = _DIGEST_SIZE * 2
+
+# Upper bound on the decimal timestamp prefix of a token.
+_MAX_TIMESTAMP_DIGITS: int = 12
+
+
+@functools.lru_cache(maxsize=4)
+def _keyed_template(csrf_secret: str) -> hashlib.blake2b:
+    """Return a BLAKE2b context already keyed with *csrf_secret*.
+
+    Keying absorbs a full block, so it is done once per secret and each
+    signature starts from a ``copy()``.  BLAKE2b accepts at most 64 key
+    bytes; longer secrets are hashed down first.
+    """
+    key = csrf_secret.encode()
+    if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+        key = hashlib.blake2b(key).digest()
+    return hashlib.blake2b(key=key, digest_size=_DIGEST_SIZE)
+
+
+def _sign(csrf_secret: str, payload: str) -> str:
+    mac = _keyed_template(csrf_secret).copy()
+    mac.update(payload.encode())
+    return mac.hexdigest()
 
-class CSRFMiddleware(BaseHTTPMiddleware):
+
+class CSRFMiddleware(CheckMiddleware):
     """Validate CSRF tokens on state-changing requests.
 
-    Tokens are HMAC(csrf_secret, session_token || timestamp) so they can
-    be validated without server-side storage.
+    Tokens are BLAKE2b(key=csrf_secret, session_token || timestamp) so they
+    can be validated without server-side storage.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Response]) -> Response:
+    def check(self, scope: Scope) -> JSONErrorResponse | None:
+        """Return a ``403`` response if *scope* fails CSRF validation."""
+        # CSRF disabled (no config / secret): bail out before any other work.
+        # Config is only attached during lifespan startup and sections can be
+        # replaced at runtime, so this cannot be decided at registration.
+        config = self._resolve_config(scope)
+        if config is None or not config.web_security.csrf_secret:
+            return None
+
         # Safe methods don't need CSRF.
-        if request.method in _SAFE_METHODS:
-            return await call_next(request)
+        if scope["method"] in _SAFE_METHODS:
+            return None
 
-        path = request.url.path
+        path = scope["path"]
 
         # Exempt paths.
-        if any(path.startswith(p) for p in _EXEMPT_PREFIXES):
-            return await call_next(request)
+        if path.startswith(_EXEMPT_PREFIXES):
+            return None
 
-        config = getattr(request.app.state, "config", None)
-        if config is None or not config.web_security.csrf_secret:
-            return await call_next(request)
+        request = Request(scope)
 
         # Require session for CSRF check.
         session = getattr(request.state, "session", None)
         if session is None:
             # No session = auth middleware will reject separately.
-            return await call_next(request)
+            return None
 
         csrf_token = request.headers.get("x-csrf-token", "")
         if not csrf_token:
-            return JSONResponse(
-                status_code=403,
-                content={"detail": "CSRF token missing"},
-            )
+            return _TOKEN_MISSING
 
         if not self._validate_token(
             csrf_token,
@@ -70,12 +105,9 @@ class CSRFMiddleware(BaseHTTPMiddleware):
             session.session_id,
         ):
             logger.warning("CSRF token validation failed: path=%s", path)
-            return JSONResponse(
-                status_code=403,
-                content={"detail": "CSRF token invalid or expired"},
-            )
+            return _TOKEN_INVALID
 
-        return await call_next(request)
+        return None
 
     # ------------------------------------------------------------------
     # Token generation / validation
@@ -85,30 +117,28 @@ class CSRFMiddleware(BaseHTTPMiddleware):
     def generate_token(csrf_secret: str, session_id: str) -> str:
         """Create a new CSRF token bound to the session."""
         timestamp = str(int(time.time()))
-        payload = f"{session_id}:{timestamp}"
-        sig = hmac.new(
-            csrf_secret.encode(), payload.encode(), hashlib.sha256
-        ).hexdigest()
+        sig = _sign(csrf_secret, f"{session_id}:{timestamp}")
         return f"{timestamp}:{sig}"
 
     @staticmethod
     def _validate_token(token: str, csrf_secret: str, session_id: str) -> bool:
-        parts = token.split(":", 1)
-        if len(parts) != 2:
+        # Tokens are "<timestamp>:<hex signature>"; reject malformed shapes
+        # before parsing anything.
+        colon = token.find(":")
+        if not 0 < colon <= _MAX_TIMESTAMP_DIGITS:
+            return False
+        if len(token) - colon - 1 != _SIG_HEX_LENGTH:
             return False
-        timestamp_str, sig = parts
-        try:
-            timestamp = int(timestamp_str)
-        except ValueError:
+        timestamp_str = token[:colon]
+        if not (timestamp_str.isascii() and timestamp_str.isdigit()):
             return False
+        timestamp = int(timestamp_str)
+        sig = token[colon + 1:]
 
         # Check token age.
         if abs(time.time() - timestamp) > _TOKEN_MAX_AGE:
             return False
 
         # Recompute and compare.
-        payload = f"{session_id}:{timestamp_str}"
-        expected = hmac.new(
-            csrf_secret.encode(), payload.encode(), hashlib.sha256
-        ).hexdigest()
+        expected = _sign(csrf_secret, f"{session_id}:{timestamp_str}")
         return hmac.compare_digest(sig, expected)
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import functools
 import ipaddress
-from typing import Callable
+from collections import OrderedDict
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Scope
 
+from app.api.middleware.base import CheckMiddleware, JSONErrorResponse
+from app.core.config import WebSecurityConfig
 from app.core.logging import get_logger
-from app.core.network import get_client_ip
+from app.core.network import resolve_client_ip
 
 logger = get_logger(__name__)
 
@@ -21,12 +22,28 @@ _LOCAL_NETWORKS: tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...] = (
     ipaddress.IPv4Network("192.168.0.0/16"),
 )
 
+_IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
 
-class IPFilterMiddleware(BaseHTTPMiddleware):
+# Number of recent per-IP allow/deny decisions kept by each filter.
+_DECISION_CACHE_SIZE: int = 512
+
+_MISS = object()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ip(ip_str: str) -> _IPAddress | None:
+    """Parse *ip_str*, memoised so repeat clients skip ``ip_address``."""
+    try:
+        return ipaddress.ip_address(ip_str)
+    except ValueError:
+        return None
+
+
+class IPFilterMiddleware(CheckMiddleware):
     """Restrict access based on client IP address.
 
-    Reads ``config.web_security`` lazily from ``request.app.state.config``
-    so the middleware can be registered before lifespan runs.
+    Reads ``config.web_security`` from ``app.state.config`` (resolved on the
+    first request) so the middleware can be registered before lifespan runs.
 
     Behaviour:
 
@@ -34,61 +51,93 @@ class IPFilterMiddleware(BaseHTTPMiddleware):
       all IPs are permitted (default open-access for development).
     * If ``allow_all_local`` is ``True``, loopback and private-network
       addresses are always allowed regardless of the allowlist.
-    * Otherwise only explicitly listed IPs pass through.
+    * Otherwise only explicitly listed IPs pass through.  Entries may be
+      single addresses or CIDR networks.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Response]) -> Response:
-        config = getattr(request.app.state, "config", None)
+    def __init__(self, app: ASGIApp) -> None:
+        super().__init__(app)
+        # client ip -> denial reason (None = allowed), least recent first.
+        # Only valid for the ``web_security`` object it was computed from.
+        self._decisions: OrderedDict[str, str | None] = OrderedDict()
+        self._decisions_source: WebSecurityConfig | None = None
+
+    def check(self, scope: Scope) -> JSONErrorResponse | None:
+        """Return a ``403`` response if the client of *scope* is not allowed."""
+        config = self._resolve_config(scope)
         if config is None:
-            return await call_next(request)
+            return None
 
-        allowed_ips = config.web_security.allowed_ips
-        allow_local = config.web_security.allow_all_local
+        web_security = config.web_security
 
         # No restrictions configured -> allow everything.
-        if not allowed_ips and not allow_local:
-            return await call_next(request)
+        if not web_security.allowed_ips and not web_security.allow_all_local:
+            return None
+
+        # Hot-reload swaps the section object; drop decisions made under the old one.
+        if web_security is not self._decisions_source:
+            self._decisions.clear()
+            self._decisions_source = web_security
+
+        client_ip = resolve_client_ip(scope, web_security.trusted_proxy_set)
+
+        denial = self._decisions.get(client_ip, _MISS)
+        if denial is _MISS:
+            denial = self._decide(client_ip, web_security)
+            self._decisions[client_ip] = denial
+            if len(self._decisions) > _DECISION_CACHE_SIZE:
+                self._decisions.popitem(last=False)
+        else:
+            self._decisions.move_to_end(client_ip)
+
+        if denial is None:
+            return None
+        logger.warning("IP denied (%s): %s", denial, client_ip)
+        return self._forbidden(client_ip)
 
-        client_ip = self._get_client_ip(request)
+    def _decide(self, client_ip: str, web_security: WebSecurityConfig) -> str | None:
+        """Return why *client_ip* is denied, or ``None`` if it is allowed."""
+        allowed_ips = web_security.allowed_ip_set
+        allow_local = web_security.allow_all_local
 
         # allow_all_local: accept any private / loopback address.
         if allow_local and self._is_local(client_ip):
-            return await call_next(request)
+            return None
 
         # Explicit allowlist check.
-        if allowed_ips and client_ip in allowed_ips:
-            return await call_next(request)
+        if allowed_ips and (
+            client_ip in allowed_ips
+            or self._in_networks(client_ip, web_security.allowed_networks)
+        ):
+            return None
 
         # If allowed_ips is empty but allow_local is True, non-local IPs are denied.
         if not allowed_ips and allow_local:
-            logger.warning("IP denied (non-local): %s", client_ip)
-            return self._forbidden(client_ip)
-
-        logger.warning("IP denied (not in allowlist): %s", client_ip)
-        return self._forbidden(client_ip)
+            return "non-local"
+        return "not in allowlist"
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _get_client_ip(request: Request) -> str:
-        """Return the client IP using the shared network utility."""
-        config = getattr(request.app.state, "config", None)
-        trusted = config.web_security.trusted_proxies if config else ()
-        return get_client_ip(request, trusted_proxies=trusted)
+    def _is_local(ip_str: str) -> bool:
+        return IPFilterMiddleware._in_networks(ip_str, _LOCAL_NETWORKS)
 
     @staticmethod
-    def _is_local(ip_str: str) -> bool:
-        try:
-            addr = ipaddress.ip_address(ip_str)
-        except ValueError:
+    def _in_networks(
+        ip_str: str,
+        networks: tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...],
+    ) -> bool:
+        if not networks:
+            return False
+        addr = _parse_ip(ip_str)
+        if addr is None:
             return False
-        return any(addr in net for net in _LOCAL_NETWORKS)
+        return any(addr in net for net in networks)
 
     @staticmethod
-    def _forbidden(ip: str) -> JSONResponse:
-        return JSONResponse(
-            status_code=403,
-            content={"detail": f"Access denied for IP: {ip}"},
+    def _forbidden(ip: str) -> JSONErrorResponse:
+        return JSONErrorResponse.from_content(
+            403, {"detail": f"Access denied for IP: {ip}"}
         )
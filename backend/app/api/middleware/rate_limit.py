@@ -3,20 +3,18 @@
 from __future__ import annotations
 
 import time
-from collections import defaultdict
-from typing import Callable
+from collections import OrderedDict, deque
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Scope
 
+from app.api.middleware.base import CheckMiddleware, JSONErrorResponse, encode_json
 from app.core.constants import (
     DEFAULT_API_RATE_LIMIT,
     DEFAULT_LOGIN_RATE_LIMIT,
     RATE_LIMIT_WINDOW_SECONDS,
 )
 from app.core.logging import get_logger
-from app.core.network import get_client_ip
+from app.core.network import resolve_client_ip
 
 logger = get_logger(__name__)
 
@@ -32,25 +30,42 @@ _EXEMPT_PREFIXES: tuple[str, ...] = (
     "/assets",
 )
 
+_TOO_MANY_REQUESTS_BODY: bytes = encode_json(
+    {"detail": "Too many requests. Please try again later."}
+)
+
+_WINDOW_NS: int = RATE_LIMIT_WINDOW_SECONDS * 1_000_000_000
+
+# Upper bound on tracked IPs; least recently seen IPs are evicted first.
+_MAX_TRACKED_IPS: int = 10_000
+
+
+class RateLimitMiddleware(CheckMiddleware):
+    """Enforce per-IP request rate limits using a sliding window.
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Enforce per-IP request rate limits using a sliding window."""
+    ``check`` is deliberately synchronous: the prune / count / append /
+    evict sequence contains no ``await``, so it runs atomically on the
+    event loop and concurrent requests from one IP cannot interleave.
+    No lock is needed as long as that block stays free of suspension points.
+    """
 
-    def __init__(self, app: object) -> None:
-        super().__init__(app)  # type: ignore[arg-type]
-        # ip -> list of request timestamps
-        self._windows: dict[str, list[float]] = defaultdict(list)
+    def __init__(self, app: ASGIApp) -> None:
+        super().__init__(app)
+        # ip -> monotonic request timestamps (ns), oldest first; ordered by
+        # last access
+        self._windows: OrderedDict[str, deque[int]] = OrderedDict()
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Response]) -> Response:
-        path = request.url.path
+    def check(self, scope: Scope) -> JSONErrorResponse | None:
+        """Record a hit for the client of *scope*; return ``429`` when over limit."""
+        path = scope["path"]
 
         # Skip exempt paths.
-        if any(path.startswith(p) for p in _EXEMPT_PREFIXES):
-            return await call_next(request)
+        if path.startswith(_EXEMPT_PREFIXES):
+            return None
 
-        config = getattr(request.app.state, "config", None)
-        trusted = config.web_security.trusted_proxies if config else ()
-        client_ip = get_client_ip(request, trusted_proxies=trusted)
+        config = self._resolve_config(scope)
+        trusted = config.web_security.trusted_proxy_set if config else ()
+        client_ip = resolve_client_ip(scope, trusted)
 
         # Determine limit for this path.
         limit = DEFAULT_API_RATE_LIMIT
@@ -59,33 +74,36 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 limit = route_limit
                 break
 
-        now = time.monotonic()
-        window = self._windows[client_ip]
+        now = time.monotonic_ns()
+        # get/assign rather than setdefault(): setdefault would build a
+        # throwaway deque on every request for an already-tracked IP.
+        window = self._windows.get(client_ip)
+        if window is None:
+            window = self._windows[client_ip] = deque()
+        else:
+            self._windows.move_to_end(client_ip)
 
         # Prune entries outside the window.
-        cutoff = now - RATE_LIMIT_WINDOW_SECONDS
-        self._windows[client_ip] = window = [t for t in window if t > cutoff]
+        cutoff = now - _WINDOW_NS
+        while window and window[0] <= cutoff:
+            window.popleft()
 
         if len(window) >= limit:
-            retry_after = int(RATE_LIMIT_WINDOW_SECONDS - (now - window[0])) + 1
+            retry_after = (_WINDOW_NS - (now - window[0])) // 1_000_000_000 + 1
             logger.warning(
                 "Rate limit exceeded: ip=%s path=%s (%d/%d)",
                 client_ip, path, len(window), limit,
             )
-            return JSONResponse(
-                status_code=429,
-                content={"detail": "Too many requests. Please try again later."},
-                headers={"Retry-After": str(retry_after)},
+            return JSONErrorResponse(
+                429,
+                _TOO_MANY_REQUESTS_BODY,
+                headers=((b"retry-after", str(retry_after).encode()),),
             )
 
         window.append(now)
 
-        # Periodic cleanup: cap dictionary size to prevent memory growth.
-        if len(self._windows) > 10_000:
-            oldest_ips = sorted(
-                self._windows, key=lambda ip: self._windows[ip][-1] if self._windows[ip] else 0
-            )[:5000]
-            for ip in oldest_ips:
-                del self._windows[ip]
+        # Cap dictionary size to prevent memory growth.
+        while len(self._windows) > _MAX_TRACKED_IPS:
+            self._windows.popitem(last=False)
 
-        return await call_next(request)
+        return None
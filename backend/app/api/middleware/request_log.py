@@ -1,30 +1,47 @@
 from __future__ import annotations
 
+import logging
 import time
-from typing import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import get_logger
 
 logger = get_logger("api.access")
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Log every HTTP request with method, path, status code, and duration."""
-
-    async def dispatch(self, request: Request, call_next: Callable[..., Response]) -> Response:
-        start = time.perf_counter()
-        response: Response = await call_next(request)
-        duration_ms = (time.perf_counter() - start) * 1000
-
+def log_request(scope: Scope, status_code: int, elapsed_ns: int) -> None:
+    """Write one access-log line for a finished HTTP request."""
+    # Skip building the argument tuple entirely when access logs are off.
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
             "%s %s -> %d (%.1fms)",
-            request.method,
-            request.url.path,
-            response.status_code,
-            duration_ms,
+            scope["method"],
+            scope["path"],
+            status_code,
+            elapsed_ns / 1_000_000,
         )
-        return response
+
+
+class RequestLoggingMiddleware:
+    """Log every HTTP request with method, path, status code, and duration."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start_ns = time.perf_counter_ns()
+        await self.app(scope, receive, send_wrapper)
+        log_request(scope, status_code, time.perf_counter_ns() - start_ns)
@@ -2,40 +2,69 @@
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import TYPE_CHECKING
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+if TYPE_CHECKING:
+    from app.core.config import Config
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+# Constant headers, pre-encoded once so each response only extends a list.
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"0"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"camera=(), microphone=(self), geolocation=()"),
+    (
+        b"content-security-policy",
+        b"default-src 'self'; "
+        b"script-src 'self'; "
+        b"style-src 'self' 'unsafe-inline'; "
+        b"connect-src 'self' ws: wss:; "
+        b"img-src 'self' data:; "
+        b"font-src 'self'",
+    ),
+)
+
+_HSTS_HEADER: tuple[bytes, bytes] = (
+    b"strict-transport-security",
+    b"max-age=31536000; includeSubDomains",
+)
+
+
+def add_security_headers(message: Message, https_enabled: bool) -> None:
+    """Append the security headers to an ``http.response.start`` *message*."""
+    headers = message.setdefault("headers", [])
+    if not isinstance(headers, list):
+        headers = message["headers"] = list(headers)
+    headers.extend(_SECURITY_HEADERS)
+
+    # HSTS only when HTTPS is enabled.
+    if https_enabled:
+        headers.append(_HSTS_HEADER)
+
+
+class SecurityHeadersMiddleware:
     """Add standard security headers to every response."""
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Response]) -> Response:
-        response = await call_next(request)
-
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "0"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = (
-            "camera=(), microphone=(self), geolocation=()"
-        )
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "connect-src 'self' ws: wss:; "
-            "img-src 'self' data:; "
-            "font-src 'self'"
-        )
-
-        # HSTS only when HTTPS is enabled.
-        config = getattr(request.app.state, "config", None)
-        if config and config.web_security.https_enabled:
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains"
-            )
-
-        return response
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._config: Config | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        config = self._config
+        if config is None:
+            config = self._config = getattr(scope["app"].state, "config", None)
+        https_enabled = bool(config and config.web_security.https_enabled)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                add_security_headers(message, https_enabled)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.api.dependencies import get_activity_repo
 from app.core.logging import get_logger
@@ -25,7 +25,7 @@ async def list_activities(
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     activity_repo: ActivityRepository = Depends(get_activity_repo),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Return a paginated timeline of bot activities."""
     start_dt: Optional[datetime] = None
     end_dt: Optional[datetime] = None
@@ -34,7 +34,7 @@ async def list_activities(
         try:
             start_dt = datetime.fromisoformat(start)
         except ValueError:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"detail": "Invalid start date format. Use ISO format."},
             )
@@ -42,7 +42,7 @@ async def list_activities(
         try:
             end_dt = datetime.fromisoformat(end)
         except ValueError:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"detail": "Invalid end date format. Use ISO format."},
             )
@@ -50,7 +50,7 @@ async def list_activities(
     # Use status filter path if provided
     if status:
         activities = await activity_repo.get_by_status(status, limit=limit)
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "items": [a.model_dump(mode="json") for a in activities],
                 "total": len(activities),
@@ -67,7 +67,7 @@ async def list_activities(
         offset=offset,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "items": [a.model_dump(mode="json") for a in activities],
             "total": len(activities),
@@ -81,12 +81,12 @@ async def list_activities(
 async def get_activity(
     activity_id: int,
     activity_repo: ActivityRepository = Depends(get_activity_repo),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Return details for a single activity."""
     activity = await activity_repo.get_by_id(activity_id)
     if activity is None:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"detail": f"Activity {activity_id} not found"},
         )
-    return JSONResponse(content=activity.model_dump(mode="json"))
+    return ORJSONResponse(content=activity.model_dump(mode="json"))
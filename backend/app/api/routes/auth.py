@@ -3,12 +3,16 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel as PydanticBaseModel
+from starlette.concurrency import run_in_threadpool
 
+from app.api.etag import compute_etag, json_etag_response
+from app.api.middleware.csrf import CSRFMiddleware
 from app.core.logging import get_logger
-from app.core.network import get_client_ip
+from app.core.network import resolve_client_ip
 from app.models.auth import LoginRequest, LoginResponse, Session
 from app.services.auth import AuthService
 
@@ -57,7 +61,7 @@ async def login(body: LoginRequest, request: Request, response: Response) -> Log
         )
 
     # Verify password
-    if not auth_service.verify_password(body.password):
+    if not await run_in_threadpool(auth_service.verify_password, body.password):
         auth_service.record_login_attempt(client_ip, success=False)
         logger.warning("Failed login attempt: ip=%s", client_ip)
         return LoginResponse(success=False, error="Invalid password")
@@ -67,12 +71,8 @@ async def login(body: LoginRequest, request: Request, response: Response) -> Log
     session = auth_service.create_session(client_ip)
 
     response.set_cookie(
-        key="session_token",
         value=session.session_id,
-        httponly=True,
-        samesite="lax",
-        secure=request.app.state.config.web_security.https_enabled,
-        max_age=request.app.state.config.web_security.session_timeout_hours * 3600,
+        **request.app.state.config.web_security.session_cookie_kwargs,
     )
 
     logger.info("Successful login: ip=%s", client_ip)
@@ -80,7 +80,7 @@ async def login(body: LoginRequest, request: Request, response: Response) -> Log
 
 
 @router.post("/logout")
-async def logout(request: Request, response: Response) -> JSONResponse:
+async def logout(request: Request, response: Response) -> ORJSONResponse:
     """Invalidate the current session and clear the cookie."""
     auth_service: AuthService = request.app.state.auth_service
     token = _extract_token(request)
@@ -89,11 +89,32 @@ async def logout(request: Request, response: Response) -> JSONResponse:
         auth_service.invalidate_session(token)
 
     response.delete_cookie(key="session_token")
-    return JSONResponse(content={"detail": "Logged out"})
+    return ORJSONResponse(content={"detail": "Logged out"})
 
 
-@router.get("/status", response_model=AuthStatusResponse)
-async def auth_status(request: Request) -> AuthStatusResponse:
+def _render_auth_status(authenticated: bool, setup_complete: bool) -> tuple[bytes, str]:
+    body = orjson.dumps(
+        AuthStatusResponse(
+            authenticated=authenticated, setup_complete=setup_complete
+        ).model_dump()
+    )
+    return body, compute_etag(body)
+
+
+# The status payload has only four possible values: serialise each once.
+_AUTH_STATUS_BODIES: dict[tuple[bool, bool], tuple[bytes, str]] = {
+    (authenticated, setup_complete): _render_auth_status(authenticated, setup_complete)
+    for authenticated in (False, True)
+    for setup_complete in (False, True)
+}
+
+
+@router.get(
+    "/status",
+    response_model=None,
+    responses={200: {"model": AuthStatusResponse}},
+)
+async def auth_status(request: Request) -> Response:
     """Return current authentication state."""
     auth_service: AuthService = request.app.state.auth_service
     setup_complete = auth_service.is_setup_complete()
@@ -106,10 +127,8 @@ async def auth_status(request: Request) -> AuthStatusResponse:
         if token:
             session = auth_service.validate_session(token)
 
-    return AuthStatusResponse(
-        authenticated=session is not None,
-        setup_complete=setup_complete,
-    )
+    body, etag = _AUTH_STATUS_BODIES[session is not None, setup_complete]
+    return json_etag_response(request, body, etag)
 
 
 @router.post("/setup-password", response_model=SetupPasswordResponse)
@@ -127,7 +146,7 @@ async def setup_password(body: SetupPasswordRequest, request: Request) -> SetupP
     if not ok:
         return SetupPasswordResponse(success=False, message=reason)
 
-    auth_service.set_password(body.password)
+    await run_in_threadpool(auth_service.set_password, body.password)
     logger.info("Initial password set via setup endpoint")
     return SetupPasswordResponse(success=True, message="Password configured successfully.")
 
@@ -149,30 +168,30 @@ async def change_password(body: ChangePasswordRequest, request: Request) -> Chan
     session = getattr(request.state, "session", None)
     if session is None:
         return ChangePasswordResponse(success=False, message="Authentication required.")
-    ok, message = auth_service.change_password(body.current_password, body.new_password)
+    ok, message = await run_in_threadpool(
+        auth_service.change_password, body.current_password, body.new_password
+    )
     if ok:
         logger.info("Password changed: ip=%s", _client_ip(request))
     return ChangePasswordResponse(success=ok, message=message)
 
 
 @router.post("/ws-ticket")
-async def create_ws_ticket(request: Request) -> JSONResponse:
+async def create_ws_ticket(request: Request) -> ORJSONResponse:
     """Create a short-lived one-time ticket for WebSocket authentication."""
     auth_service: AuthService = request.app.state.auth_service
     token = _extract_token(request)
     if not token:
-        return JSONResponse(status_code=401, content={"detail": "Authentication required"})
+        return ORJSONResponse(status_code=401, content={"detail": "Authentication required"})
     ticket = auth_service.create_ws_ticket(token)
     if ticket is None:
-        return JSONResponse(status_code=401, content={"detail": "Invalid session"})
-    return JSONResponse(content={"ticket": ticket})
+        return ORJSONResponse(status_code=401, content={"detail": "Invalid session"})
+    return ORJSONResponse(content={"ticket": ticket})
 
 
 @router.get("/csrf-token")
-async def get_csrf_token(request: Request) -> JSONResponse:
+async def get_csrf_token(request: Request) -> ORJSONResponse:
     """Return a CSRF token for the current session."""
-    from app.api.middleware.csrf import CSRFMiddleware
-
     config = request.app.state.config
     session = getattr(request.state, "session", None)
 
@@ -184,7 +203,7 @@ async def get_csrf_token(request: Request) -> JSONResponse:
             session = auth_service.validate_session(token)
 
     if session is None:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=401,
             content={"detail": "Authentication required"},
         )
@@ -192,7 +211,7 @@ async def get_csrf_token(request: Request) -> JSONResponse:
     csrf_token = CSRFMiddleware.generate_token(
         config.web_security.csrf_secret, session.session_id
     )
-    return JSONResponse(content={"csrf_token": csrf_token})
+    return ORJSONResponse(content={"csrf_token": csrf_token})
 
 
 # ------------------------------------------------------------------
@@ -201,16 +220,18 @@ async def get_csrf_token(request: Request) -> JSONResponse:
 
 
 def _client_ip(request: Request) -> str:
+    # Normally already resolved by the security middleware for this request.
     config = getattr(request.app.state, "config", None)
-    trusted = config.web_security.trusted_proxies if config else ()
-    return get_client_ip(request, trusted_proxies=trusted)
+    trusted = config.web_security.trusted_proxy_set if config else ()
+    return resolve_client_ip(request.scope, trusted)
 
 
 def _extract_token(request: Request) -> str | None:
     token = request.cookies.get("session_token")
     if token:
         return token
-    auth_header = request.headers.get("authorization", "")
-    if auth_header.lower().startswith("bearer "):
+    auth_header = request.headers.get("authorization")
+    # Case-fold only the scheme, not the whole (possibly long) token.
+    if auth_header and auth_header[:7].lower() == "bearer ":
         return auth_header[7:].strip()
     return None
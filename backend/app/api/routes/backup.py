@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
+import hashlib
+import time
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Request, UploadFile, File
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Request, Response, UploadFile, File
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
 from app.core.logging import get_logger
 
@@ -17,8 +19,13 @@ router = APIRouter(prefix="/api/backup", tags=["backup"])
 _BACKUP_DIR = Path("backups")
 
 
+def _write_backup_file(filepath: Path, payload: bytes) -> None:
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    filepath.write_bytes(payload)
+
+
 @router.post("/export")
-async def export_backup(request: Request) -> JSONResponse:
+async def export_backup(request: Request) -> Response:
     """Create a full backup of the database and config.
 
     Returns the backup data as JSON and optionally saves it to disk.
@@ -29,36 +36,42 @@ async def export_backup(request: Request) -> JSONResponse:
         data = await backup_service.export_backup()
     except Exception as exc:
         logger.error("Backup export failed: %s", exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"detail": "Backup export failed. Check server logs for details."},
         )
 
+    # Serialise once: the same bytes go to disk and into the response.
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    del data
+
     # Save to disk
-    _BACKUP_DIR.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    ts = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
     filename = f"backup_{ts}.json"
     filepath = _BACKUP_DIR / filename
 
     try:
-        filepath.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        # Off the event loop: large backups would otherwise stall every
+        # other request for the duration of the disk write.
+        await run_in_threadpool(_write_backup_file, filepath, payload)
     except Exception as exc:
         logger.error("Failed to write backup file: %s", exc)
 
-    return JSONResponse(
-        content={
-            "detail": "Backup exported successfully",
-            "filename": filename,
-            "data": data,
-        }
+    head = orjson.dumps({
+        "detail": "Backup exported successfully",
+        "filename": filename,
+        "sha256": hashlib.sha256(payload).hexdigest(),
+    })
+    # Splice the pre-serialised payload in as "data" instead of encoding
+    # the whole backup a second time.
+    return Response(
+        content=b"".join((head[:-1], b',"data":', payload, b"}")),
+        media_type="application/json",
     )
 
 
 @router.post("/import")
-async def import_backup(request: Request) -> JSONResponse:
+async def import_backup(request: Request) -> ORJSONResponse:
     """Import a backup from JSON body.
 
     Expects the backup data object directly in the request body.
@@ -68,14 +81,14 @@ async def import_backup(request: Request) -> JSONResponse:
     try:
         body: dict[str, Any] = await request.json()
     except Exception as exc:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"detail": "Invalid JSON body"},
         )
 
     # Validate minimal structure
     if "tables" not in body:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"detail": "Missing 'tables' key in backup data"},
         )
@@ -83,13 +96,13 @@ async def import_backup(request: Request) -> JSONResponse:
     # Re-authenticate for destructive operation.
     password = body.get("password")
     if not password:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"detail": "Password required for backup import"},
         )
     auth_service = request.app.state.auth_service
-    if not auth_service.verify_password(password):
-        return JSONResponse(
+    if not await run_in_threadpool(auth_service.verify_password, password):
+        return ORJSONResponse(
             status_code=401,
             content={"detail": "Invalid password"},
         )
@@ -98,11 +111,11 @@ async def import_backup(request: Request) -> JSONResponse:
         await backup_service.import_backup(body)
     except Exception as exc:
         logger.error("Backup import failed: %s", exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"detail": "Backup import failed. Check server logs for details."},
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={"detail": "Backup imported successfully"}
     )
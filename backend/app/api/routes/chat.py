@@ -1,16 +1,29 @@
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+from typing import TYPE_CHECKING, Optional
 
-from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel as PydanticBaseModel
 
-from app.api.dependencies import get_conversation_repo, get_llm_service
+from app.api.dependencies import (
+    get_config,
+    get_conversation_repo,
+    get_llm_service,
+    get_mission_service,
+    get_prompt_builder,
+)
+from app.core.config import Config
 from app.core.logging import get_logger
 from app.models.conversation import Conversation, ConversationCreate
 from app.repositories.conversation import ConversationRepository
 from app.services.llm import LLMService
+from app.services.mission import MissionService
+from app.services.prompt_builder import PromptBuilder
+
+if TYPE_CHECKING:
+    from app.models.mission import Mission
 
 logger = get_logger(__name__)
 
@@ -52,14 +65,16 @@ _MAX_HISTORY_CONTEXT: int = 20
 @router.post("", response_model=ChatResponse)
 async def send_message(
     body: ChatRequest,
-    request: Request,
+    config: Config = Depends(get_config),
     llm_service: LLMService = Depends(get_llm_service),
     conversation_repo: ConversationRepository = Depends(get_conversation_repo),
+    mission_service: Optional[MissionService] = Depends(get_mission_service),
+    prompt_builder: Optional[PromptBuilder] = Depends(get_prompt_builder),
 ) -> ChatResponse:
     """Send a chat message and receive the LLM response (non-streaming)."""
-    max_len = request.app.state.config.web_security.max_message_length
+    max_len = config.web_security.max_message_length
     if len(body.message) > max_len:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"detail": f"Message too long (max {max_len} characters)"},
         )
@@ -73,16 +88,20 @@ async def send_message(
         )
     )
 
-    # 2. Check for mission intent
-    mission_service = getattr(request.app.state, "mission_service", None)
-    prompt_builder = getattr(request.app.state, "prompt_builder", None)
-    mission = None
-
-    if mission_service:
-        try:
-            mission = await mission_service.create_from_chat(body.message)
-        except Exception as exc:
-            logger.warning("Mission detection failed: %s", exc)
+    # 2. Check for mission intent.  History for the regular-chat path is
+    # fetched concurrently so plain messages don't wait on detection first.
+    # A failed history read is only raised on that path, so it never
+    # affects mission creation.
+    mission, recent = await asyncio.gather(
+        _detect_mission(mission_service, body.message),
+        conversation_repo.get_recent(
+            limit=_MAX_HISTORY_CONTEXT,
+            platform_filter=body.platform,
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(mission, BaseException):
+        raise mission
 
     if mission:
         # Mission created — build confirmation response
@@ -101,25 +120,23 @@ async def send_message(
             mission.id, mission.topic,
         )
     else:
-        # 3. Regular chat — load history and call LLM
-        recent = await conversation_repo.get_history(
-            limit=_MAX_HISTORY_CONTEXT,
-            platform_filter=body.platform,
-        )
+        # 3. Regular chat — call LLM with recent history
+        if isinstance(recent, BaseException):
+            raise recent
 
         messages: list[dict[str, str]] = []
-        for conv in reversed(recent):
-            messages.append({"role": conv.role, "content": conv.content})
-
         # Inject system prompt if prompt_builder is available
         if prompt_builder:
             system_prompt = prompt_builder.build_system_prompt()
-            messages.insert(0, {"role": "system", "content": system_prompt})
+            messages.append({"role": "system", "content": system_prompt})
+        messages.extend(
+            {"role": conv.role, "content": conv.content} for conv in recent
+        )
 
         response_text = await llm_service.chat(messages, stream=False)
         if not isinstance(response_text, str):
             logger.error("LLM returned non-string response: %s", type(response_text).__name__)
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=502,
                 content={"detail": "Unexpected response from language model"},
             )
@@ -146,20 +163,43 @@ async def send_message(
     )
 
 
-@router.get("/history", response_model=HistoryResponse)
+async def _detect_mission(
+    mission_service: Optional[MissionService], message: str
+) -> Optional[Mission]:
+    """Run mission detection, treating a missing service or failure as no mission."""
+    if mission_service is None:
+        return None
+    try:
+        return await mission_service.create_from_chat(message)
+    except Exception as exc:
+        logger.warning("Mission detection failed: %s", exc)
+        return None
+
+
+@router.get(
+    "/history",
+    response_model=None,
+    responses={200: {"model": HistoryResponse}},
+)
 async def get_history(
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
     platform: Optional[str] = Query(default=None),
     conversation_repo: ConversationRepository = Depends(get_conversation_repo),
-) -> HistoryResponse:
+) -> Response:
     """Retrieve conversation history with optional platform filter."""
-    conversations = await conversation_repo.get_history(
-        limit=limit,
-        offset=offset,
-        platform_filter=platform,
+    conversations, total = await asyncio.gather(
+        conversation_repo.get_history(
+            limit=limit,
+            offset=offset,
+            platform_filter=platform,
+        ),
+        conversation_repo.count_history(platform_filter=platform),
     )
-    return HistoryResponse(
-        conversations=conversations,
-        total=len(conversations),
+    # The repository already returns validated models; serialise directly
+    # instead of letting FastAPI dump and re-validate them via response_model.
+    history = HistoryResponse(conversations=conversations, total=total)
+    return Response(
+        content=history.model_dump_json(),
+        media_type="application/json",
     )
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel as PydanticBaseModel
 
 from app.core.logging import get_logger
@@ -18,18 +18,11 @@ class CommandRequest(PydanticBaseModel):
     args: dict[str, Any] = {}
 
 
-class CommandResponse(PydanticBaseModel):
-    success: bool
-    command: str
-    result: Optional[dict[str, Any]] = None
-    error: Optional[str] = None
-
-
 @router.post("")
 async def execute_command(
     body: CommandRequest,
     request: Request,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Execute a slash command.
 
     Supported commands:
@@ -39,47 +32,44 @@ async def execute_command(
     - /stop: Activate emergency stop
     """
     cmd = body.command.lstrip("/").lower()
-    args = body.args
 
-    try:
-        if cmd == "post":
-            result = await _cmd_post(request, args)
-        elif cmd == "search":
-            result = await _cmd_search(request, args)
-        elif cmd == "status":
-            result = await _cmd_status(request)
-        elif cmd == "stop":
-            result = await _cmd_stop(request)
-        else:
-            return JSONResponse(
-                status_code=400,
-                content=CommandResponse(
-                    success=False,
-                    command=cmd,
-                    error=f"Unknown command: /{cmd}. "
-                    "Supported: /post, /search, /status, /stop",
-                ).model_dump(),
-            )
-
-        return JSONResponse(
-            content=CommandResponse(
-                success=True,
-                command=cmd,
-                result=result,
-            ).model_dump(),
+    handler = _DISPATCH.get(cmd)
+    if handler is None:
+        return ORJSONResponse(
+            status_code=400,
+            content=_response(
+                False,
+                cmd,
+                error=f"Unknown command: /{cmd}. Supported: {_SUPPORTED}",
+            ),
         )
 
+    try:
+        result = await handler(request, body.args)
     except Exception as exc:
         logger.error("Command /%s failed: %s", cmd, exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
-            content=CommandResponse(
-                success=False,
-                command=cmd,
-                error="Command execution failed",
-            ).model_dump(),
+            content=_response(False, cmd, error="Command execution failed"),
         )
 
+    return ORJSONResponse(content=_response(True, cmd, result=result))
+
+
+def _response(
+    success: bool,
+    command: str,
+    result: Optional[dict[str, Any]] = None,
+    error: Optional[str] = None,
+) -> dict[str, Any]:
+    """Build the ``{success, command, result, error}`` response envelope."""
+    return {
+        "success": success,
+        "command": command,
+        "result": result,
+        "error": error,
+    }
+
 
 # ------------------------------------------------------------------
 # Command handlers
@@ -156,7 +146,7 @@ async def _cmd_search(request: Request, args: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-async def _cmd_status(request: Request) -> dict[str, Any]:
+async def _cmd_status(request: Request, args: dict[str, Any]) -> dict[str, Any]:
     """Return system status summary."""
     scheduler = request.app.state.scheduler
     kill_switch = request.app.state.kill_switch
@@ -171,7 +161,7 @@ async def _cmd_status(request: Request) -> dict[str, Any]:
     }
 
 
-async def _cmd_stop(request: Request) -> dict[str, Any]:
+async def _cmd_stop(request: Request, args: dict[str, Any]) -> dict[str, Any]:
     """Activate the emergency kill switch."""
     kill_switch = request.app.state.kill_switch
 
@@ -180,3 +170,19 @@ async def _cmd_stop(request: Request) -> dict[str, Any]:
 
     await kill_switch.activate(source="command")
     return {"activated": True}
+
+
+# ------------------------------------------------------------------
+# Dispatch table
+# ------------------------------------------------------------------
+
+_DISPATCH: dict[
+    str, Callable[[Request, dict[str, Any]], Awaitable[dict[str, Any]]]
+] = {
+    "post": _cmd_post,
+    "search": _cmd_search,
+    "status": _cmd_status,
+    "stop": _cmd_stop,
+}
+
+_SUPPORTED = ", ".join(f"/{name}" for name in _DISPATCH)
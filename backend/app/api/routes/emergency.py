@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.logging import get_logger
 
@@ -11,7 +11,7 @@ router = APIRouter(prefix="/api/emergency", tags=["emergency"])
 
 
 @router.post("-stop")
-async def emergency_stop(request: Request) -> JSONResponse:
+async def emergency_stop(request: Request) -> ORJSONResponse:
     """Activate the emergency kill switch.
 
     Stops the scheduler and task queue immediately.
@@ -19,7 +19,7 @@ async def emergency_stop(request: Request) -> JSONResponse:
     kill_switch = request.app.state.kill_switch
 
     if kill_switch.is_active:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=409,
             content={"detail": "Emergency stop already active"},
         )
@@ -27,13 +27,13 @@ async def emergency_stop(request: Request) -> JSONResponse:
     await kill_switch.activate(source="api")
     logger.warning("Emergency stop activated via API")
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={"detail": "Emergency stop activated", "active": True}
     )
 
 
 @router.post("-resume")
-async def emergency_resume(request: Request) -> JSONResponse:
+async def emergency_resume(request: Request) -> ORJSONResponse:
     """Deactivate the emergency kill switch.
 
     Clears the stop state and removes the STOP_BOT file if present.
@@ -42,7 +42,7 @@ async def emergency_resume(request: Request) -> JSONResponse:
     kill_switch = request.app.state.kill_switch
 
     if not kill_switch.is_active:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=409,
             content={"detail": "Emergency stop is not active"},
         )
@@ -59,7 +59,7 @@ async def emergency_resume(request: Request) -> JSONResponse:
         logger.info("Scheduler and task queue restarted after emergency resume")
     except Exception as exc:
         logger.error("Failed to restart services after resume: %s", exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "detail": "Emergency stop cleared but failed to restart services",
@@ -67,18 +67,18 @@ async def emergency_resume(request: Request) -> JSONResponse:
             },
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={"detail": "Emergency stop deactivated, services restarted", "active": False}
     )
 
 
 @router.get("-status")
-async def emergency_status(request: Request) -> JSONResponse:
+async def emergency_status(request: Request) -> ORJSONResponse:
     """Return the current emergency stop state."""
     kill_switch = request.app.state.kill_switch
     scheduler = request.app.state.scheduler
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "active": kill_switch.is_active,
             "scheduler_running": scheduler.is_running,
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
 from app.api.dependencies import get_collected_info_repo
+from app.api.etag import json_etag_response
 from app.core.logging import get_logger
+from app.models.collected_info import CollectedInfo
 from app.repositories.collected_info import CollectedInfoRepository
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/collected-info", tags=["collected-info"])
 
+_ITEMS_ADAPTER = TypeAdapter(list[CollectedInfo])
+
 
 @router.get("")
 async def list_collected_info(
@@ -22,65 +29,70 @@ async def list_collected_info(
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     repo: CollectedInfoRepository = Depends(get_collected_info_repo),
-) -> JSONResponse:
+) -> Response:
     """Return a list of collected information items."""
-    items = await repo.search(
-        query=query,
-        category=category,
-        bookmarked_only=bookmarked,
-        limit=limit,
-        offset=offset,
+    items, total = await asyncio.gather(
+        repo.search(
+            query=query,
+            category=category,
+            bookmarked_only=bookmarked,
+            limit=limit,
+            offset=offset,
+        ),
+        repo.count_search(
+            query=query, category=category, bookmarked_only=bookmarked
+        ),
     )
 
-    return JSONResponse(
-        content={
-            "items": [i.model_dump(mode="json") for i in items],
-            "total": len(items),
-            "limit": limit,
-            "offset": offset,
-        }
+    # Serialise the items in one pydantic-core pass and splice them into the
+    # envelope, instead of model_dump()-ing each item and re-encoding.
+    tail = orjson.dumps({"total": total, "limit": limit, "offset": offset})
+    body = b"".join(
+        (b'{"items":', _ITEMS_ADAPTER.dump_json(items), b",", tail[1:])
     )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/categories")
 async def list_categories(
+    request: Request,
     repo: CollectedInfoRepository = Depends(get_collected_info_repo),
-) -> JSONResponse:
-    """Return all distinct categories."""
+) -> Response:
+    """Return all distinct categories (``304`` if the client's copy is current)."""
     categories = await repo.get_categories()
-    return JSONResponse(content={"categories": categories})
+    return json_etag_response(request, orjson.dumps({"categories": categories}))
 
 
 @router.get("/{item_id}")
 async def get_collected_info(
     item_id: int,
     repo: CollectedInfoRepository = Depends(get_collected_info_repo),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Return details for a single collected-info entry."""
     item = await repo.get_by_id(item_id)
     if item is None:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"detail": f"CollectedInfo {item_id} not found"},
         )
-    return JSONResponse(content=item.model_dump(mode="json"))
+    return ORJSONResponse(content=item.model_dump(mode="json"))
 
 
 @router.post("/{item_id}/bookmark")
 async def toggle_bookmark(
     item_id: int,
     repo: CollectedInfoRepository = Depends(get_collected_info_repo),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Toggle the bookmark flag on a collected-info entry."""
     try:
         new_state = await repo.toggle_bookmark(item_id)
     except ValueError:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"detail": f"CollectedInfo {item_id} not found"},
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "id": item_id,
             "bookmarked": new_state,
@@ -2,16 +2,23 @@ from __future__ import annotations
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel as PydanticBaseModel
+from pydantic import TypeAdapter
 
+from app.api.etag import json_etag_response
 from app.core.logging import get_logger
+from app.models.mission import Mission, MissionCreate
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/missions", tags=["missions"])
 
+# Missions in these states can no longer be cancelled or completed.
+_TERMINAL_STATES = frozenset({"complete", "cancelled"})
+
 
 # ------------------------------------------------------------------
 # Request / response schemas
@@ -56,70 +63,75 @@ class MissionListResponse(PydanticBaseModel):
 # ------------------------------------------------------------------
 
 
-@router.get("", response_model=MissionListResponse)
+# The schemas above document the responses; the handlers below serialise
+# ``Mission`` models directly instead of re-validating them into a
+# ``MissionResponse``.
+
+_MISSIONS_ADAPTER = TypeAdapter(list[Mission])
+
+
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": MissionListResponse}},
+)
 async def list_missions(
     request: Request,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
     status: Optional[str] = Query(default=None),
-) -> MissionListResponse:
+) -> Response:
     """List all missions with optional status filter."""
     mission_service = request.app.state.mission_service
 
-    if status:
-        missions = await mission_service._repo.get_by_status(status)
-    else:
-        missions = await mission_service.get_all_missions(limit, offset)
-
-    total = await mission_service.count_missions()
-
-    return MissionListResponse(
-        missions=[
-            MissionResponse(
-                **{
-                    **m.model_dump(),
-                    "created_at": m.created_at.isoformat() if m.created_at else "",
-                    "completed_at": m.completed_at.isoformat() if m.completed_at else None,
-                }
-            )
-            for m in missions
-        ],
-        total=total,
+    missions, total = await mission_service.get_missions_page(
+        limit, offset, status or None
     )
 
-
-@router.get("/{mission_id}", response_model=MissionResponse)
+    # One pydantic-core pass writes the page straight to JSON bytes, with no
+    # per-mission dicts in between.
+    body = b"".join((
+        b'{"missions":',
+        _MISSIONS_ADAPTER.dump_json(missions),
+        b',"total":',
+        str(total).encode(),
+        b"}",
+    ))
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/{mission_id}",
+    response_model=None,
+    responses={200: {"model": MissionResponse}},
+)
 async def get_mission(
     mission_id: int,
     request: Request,
-) -> MissionResponse | JSONResponse:
+) -> ORJSONResponse:
     """Get a single mission by ID."""
     mission_service = request.app.state.mission_service
     mission = await mission_service.get_mission(mission_id)
 
     if mission is None:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"detail": "Mission not found"},
         )
 
-    return MissionResponse(
-        **{
-            **mission.model_dump(),
-            "created_at": mission.created_at.isoformat() if mission.created_at else "",
-            "completed_at": mission.completed_at.isoformat() if mission.completed_at else None,
-        }
-    )
+    return ORJSONResponse(content=mission.model_dump(mode="json"))
 
 
-@router.post("", response_model=MissionResponse)
+@router.post(
+    "",
+    response_model=None,
+    responses={200: {"model": MissionResponse}},
+)
 async def create_mission(
     body: MissionCreateRequest,
     request: Request,
-) -> MissionResponse:
+) -> ORJSONResponse:
     """Create a new mission manually."""
-    from app.models.mission import MissionCreate
-
     mission_service = request.app.state.mission_service
     mission = await mission_service.create_mission(
         MissionCreate(
@@ -132,63 +144,55 @@ async def create_mission(
         )
     )
 
-    return MissionResponse(
-        **{
-            **mission.model_dump(),
-            "created_at": mission.created_at.isoformat() if mission.created_at else "",
-            "completed_at": mission.completed_at.isoformat() if mission.completed_at else None,
-        }
-    )
+    return ORJSONResponse(content=mission.model_dump(mode="json"))
 
 
 @router.put("/{mission_id}/cancel")
 async def cancel_mission(
     mission_id: int,
     request: Request,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Cancel an active mission."""
     mission_service = request.app.state.mission_service
-    mission = await mission_service.get_mission(mission_id)
-
-    if mission is None:
-        return JSONResponse(
-            status_code=404,
-            content={"detail": "Mission not found"},
-        )
+    cancelled, status = await mission_service.try_cancel(mission_id)
 
-    if mission.status in ("complete", "cancelled"):
-        return JSONResponse(
+    if not cancelled:
+        if status is None:
+            return ORJSONResponse(
+                status_code=404,
+                content={"detail": "Mission not found"},
+            )
+        return ORJSONResponse(
             status_code=400,
-            content={"detail": f"Cannot cancel mission in '{mission.status}' state"},
+            content={"detail": f"Cannot cancel mission in '{status}' state"},
         )
 
-    await mission_service.cancel_mission(mission_id)
-    return JSONResponse(content={"detail": "Mission cancelled"})
+    return ORJSONResponse(content={"detail": "Mission cancelled"})
 
 
 @router.put("/{mission_id}/complete")
 async def complete_mission(
     mission_id: int,
     request: Request,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Manually complete a mission and generate summary."""
     mission_service = request.app.state.mission_service
     mission = await mission_service.get_mission(mission_id)
 
     if mission is None:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"detail": "Mission not found"},
         )
 
-    if mission.status in ("complete", "cancelled"):
-        return JSONResponse(
+    if mission.status in _TERMINAL_STATES:
+        return ORJSONResponse(
             status_code=400,
             content={"detail": f"Cannot complete mission in '{mission.status}' state"},
         )
 
     summary = await mission_service.complete_mission(mission)
-    return JSONResponse(
+    return ORJSONResponse(
         content={"detail": "Mission completed", "summary": summary}
     )
 
@@ -198,13 +202,13 @@ async def get_mission_summary(
     mission_id: int,
     request: Request,
     regenerate: bool = Query(default=False),
-) -> JSONResponse:
-    """Get or regenerate the mission summary."""
+) -> Response:
+    """Get or regenerate the mission summary (``304`` if unchanged)."""
     mission_service = request.app.state.mission_service
     mission = await mission_service.get_mission(mission_id)
 
     if mission is None:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"detail": "Mission not found"},
         )
@@ -215,4 +219,4 @@ async def get_mission_summary(
     else:
         summary = mission.summary
 
-    return JSONResponse(content={"summary": summary})
+    return json_etag_response(request, orjson.dumps({"summary": summary}))
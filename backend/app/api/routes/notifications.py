@@ -2,17 +2,21 @@ from __future__ import annotations
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
 from app.api.dependencies import get_notification_repo
 from app.core.logging import get_logger
+from app.models.notification import NotificationLog
 from app.repositories.notification import NotificationRepository
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 
+_ITEMS_ADAPTER = TypeAdapter(list[NotificationLog])
+
 
 @router.get("")
 async def list_notifications(
@@ -20,60 +24,32 @@ async def list_notifications(
     unread: Optional[bool] = Query(None, description="Filter unread only"),
     limit: int = Query(50, ge=1, le=200),
     notification_repo: NotificationRepository = Depends(get_notification_repo),
-) -> JSONResponse:
+) -> Response:
     """Return a list of notification log entries."""
-    if platform and unread:
-        items = await notification_repo.get_unprocessed(platform)
-        items = items[:limit]
-    elif platform:
-        rows = await notification_repo.fetch_all(
-            "SELECT * FROM notification_log WHERE platform = ? "
-            "ORDER BY timestamp DESC LIMIT ?",
-            (platform, limit),
-        )
-        from app.models.notification import NotificationLog
-
-        items = [NotificationLog(**r) for r in rows]
-    elif unread:
-        # Unread across all platforms
-        rows = await notification_repo.fetch_all(
-            "SELECT * FROM notification_log WHERE is_read = 0 "
-            "ORDER BY timestamp DESC LIMIT ?",
-            (limit,),
-        )
-        from app.models.notification import NotificationLog
-
-        items = [NotificationLog(**r) for r in rows]
-    else:
-        rows = await notification_repo.fetch_all(
-            "SELECT * FROM notification_log "
-            "ORDER BY timestamp DESC LIMIT ?",
-            (limit,),
-        )
-        from app.models.notification import NotificationLog
-
-        items = [NotificationLog(**r) for r in rows]
-
-    return JSONResponse(
-        content={
-            "items": [i.model_dump(mode="json") for i in items],
-            "total": len(items),
-        }
+    items = await notification_repo.list_recent(
+        limit, platform=platform, unread_only=bool(unread)
     )
 
+    body = b"".join((
+        b'{"items":',
+        _ITEMS_ADAPTER.dump_json(items),
+        b',"total":',
+        str(len(items)).encode(),
+        b"}",
+    ))
+    return Response(content=body, media_type="application/json")
+
 
 @router.post("/{notification_id}/read")
 async def mark_notification_read(
     notification_id: int,
     notification_repo: NotificationRepository = Depends(get_notification_repo),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Mark a notification as read."""
-    existing = await notification_repo.get_by_id(notification_id)
-    if existing is None:
-        return JSONResponse(
+    if not await notification_repo.mark_read(notification_id):
+        return ORJSONResponse(
             status_code=404,
             content={"detail": f"Notification {notification_id} not found"},
         )
 
-    await notification_repo.mark_responded(notification_id, response_activity_id=0)
-    return JSONResponse(content={"detail": "Notification marked as read"})
+    return ORJSONResponse(content={"detail": "Notification marked as read"})
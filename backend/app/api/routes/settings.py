@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import Any, Awaitable, Callable, Optional
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel as PydanticBaseModel
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 
 from app.api.dependencies import get_config, get_settings_repo
+from app.api.etag import json_etag_response
 from app.core.config import Config
 from app.core.logging import get_logger
+from app.models.settings import SettingsSnapshot
 from app.repositories.settings import SettingsRepository
 
 logger = get_logger(__name__)
@@ -19,6 +23,8 @@ router = APIRouter(prefix="/api/settings", tags=["settings"])
 # Sections that can be hot-reloaded at runtime
 _MUTABLE_SECTIONS = {"behavior", "voice", "web_security", "security", "ui"}
 
+_SNAPSHOTS_ADAPTER = TypeAdapter(list[SettingsSnapshot])
+
 
 class SettingsUpdateRequest(PydanticBaseModel):
     section: str
@@ -27,34 +33,31 @@ class SettingsUpdateRequest(PydanticBaseModel):
 
 @router.get("")
 async def get_settings(
+    request: Request,
     config: Config = Depends(get_config),
-) -> JSONResponse:
-    """Return the full current configuration (excluding secrets)."""
-    data = config.to_dict()
-    # Hide security filter rules from clients.
-    if "security" in data:
-        data["security"].pop("blocked_keywords", None)
-        data["security"].pop("blocked_patterns", None)
-    # Hide CSRF secret.
-    if "web_security" in data:
-        data["web_security"].pop("csrf_secret", None)
-    return JSONResponse(content=data)
+) -> Response:
+    """Return the full current configuration (excluding secrets).
+
+    Answers ``304`` when the client's ``If-None-Match`` is still current.
+    """
+    return json_etag_response(request, config.public_settings_json())
 
 
 @router.put("")
 async def update_settings(
     body: SettingsUpdateRequest,
     request: Request,
+    background_tasks: BackgroundTasks,
     config: Config = Depends(get_config),
     settings_repo: SettingsRepository = Depends(get_settings_repo),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Update a configuration section.
 
     Only mutable sections (behavior, voice, web_security, security, ui)
     can be changed at runtime.
     """
     if body.section not in _MUTABLE_SECTIONS:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "detail": (
@@ -64,47 +67,37 @@ async def update_settings(
             },
         )
 
-    # Require re-authentication for web_security changes
-    if body.section == "web_security":
-        password = body.data.get("_password")
-        auth_service = request.app.state.auth_service
-        if not password or not auth_service.verify_password(password):
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Password required to modify security settings"},
-            )
+    # Section-specific pre-checks; a returned response aborts the update.
+    hook = _SECTION_HOOKS.get(body.section)
+    if hook is not None:
+        rejection = await hook(request, body.data)
+        if rejection is not None:
+            return rejection
 
     try:
         await config.update_section(body.section, body.data)
     except Exception as exc:
         logger.error("Failed to update section '%s': %s", body.section, exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"detail": "Validation error. Check the provided data."},
         )
 
-    # Persist the change to config.json if path is available
+    # One to_dict() walk feeds the file, the history snapshot and the reply.
+    snapshot = config.to_dict()
+
+    # Persisting to config.json and the history table happens after the
+    # response is sent; the in-memory config is already authoritative.
     if config.config_path and config.config_path.exists():
-        try:
-            config.config_path.write_text(
-                json.dumps(config.to_dict(), ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-        except Exception as exc:
-            logger.error("Failed to persist config to file: %s", exc)
-
-    # Save a snapshot for history
-    try:
-        await settings_repo.save_snapshot(
-            json.dumps(config.to_dict(), ensure_ascii=False)
-        )
-    except Exception as exc:
-        logger.warning("Failed to save settings snapshot: %s", exc)
+        background_tasks.add_task(_write_config_file, config)
+    background_tasks.add_task(
+        _save_snapshot, settings_repo, orjson.dumps(snapshot).decode()
+    )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "detail": f"Section '{body.section}' updated successfully",
-            "current": config.to_dict(),
+            "current": snapshot,
         }
     )
 
@@ -113,12 +106,64 @@ async def update_settings(
 async def get_settings_history(
     limit: int = 20,
     settings_repo: SettingsRepository = Depends(get_settings_repo),
-) -> JSONResponse:
+) -> Response:
     """Return the settings change history."""
     snapshots = await settings_repo.get_history(limit=limit)
-    return JSONResponse(
-        content={
-            "items": [s.model_dump(mode="json") for s in snapshots],
-            "total": len(snapshots),
-        }
-    )
+    body = b"".join((
+        b'{"items":',
+        _SNAPSHOTS_ADAPTER.dump_json(snapshots),
+        b',"total":',
+        str(len(snapshots)).encode(),
+        b"}",
+    ))
+    return Response(content=body, media_type="application/json")
+
+
+# ------------------------------------------------------------------
+# Section hooks
+# ------------------------------------------------------------------
+
+
+async def _require_password(
+    request: Request, data: dict[str, Any]
+) -> Optional[ORJSONResponse]:
+    """Require re-authentication via ``data["_password"]``."""
+    password = data.get("_password")
+    auth_service = request.app.state.auth_service
+    if not password or not await run_in_threadpool(
+        auth_service.verify_password, password
+    ):
+        return ORJSONResponse(
+            status_code=401,
+            content={"detail": "Password required to modify security settings"},
+        )
+    return None
+
+
+_SECTION_HOOKS: dict[
+    str,
+    Callable[[Request, dict[str, Any]], Awaitable[Optional[ORJSONResponse]]],
+] = {
+    "web_security": _require_password,
+}
+
+
+# ------------------------------------------------------------------
+# Background persistence
+# ------------------------------------------------------------------
+
+
+async def _write_config_file(config: Config) -> None:
+    """Persist *config* to config.json through its serialised writer."""
+    try:
+        await config.save_to_file()
+    except Exception as exc:
+        logger.error("Failed to persist config to file: %s", exc)
+
+
+async def _save_snapshot(settings_repo: SettingsRepository, config_json: str) -> None:
+    """Record *config_json* in the settings history."""
+    try:
+        await settings_repo.save_snapshot(config_json)
+    except Exception as exc:
+        logger.warning("Failed to save settings snapshot: %s", exc)
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import shutil
 import sys
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel as PydanticBaseModel
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
 
 from app.api.dependencies import (
     get_auth_service,
@@ -18,6 +20,7 @@ from app.api.dependencies import (
     get_settings_repo,
 )
 from app.core.config import Config
+from app.core.files import update_env_file
 from app.core.logging import get_logger
 from app.platforms.registry import PlatformRegistry
 from app.repositories.settings import SettingsRepository
@@ -102,28 +105,52 @@ class SetupCompleteResponse(PydanticBaseModel):
     message: str
 
 
+# ------------------------------------------------------------------
+# Dependencies
+# ------------------------------------------------------------------
+
+
+async def _require_setup_incomplete(
+    auth_service: AuthService = Depends(get_auth_service),
+) -> None:
+    """Reject wizard writes once setup is complete.
+
+    Declared as a route dependency so the check runs before FastAPI parses
+    and validates the request body.
+    """
+    if auth_service.is_setup_complete():
+        raise HTTPException(
+            status_code=403, detail="Setup already completed. Use settings API."
+        )
+
+
 # ------------------------------------------------------------------
 # Routes
 # ------------------------------------------------------------------
 
 
-@router.get("/status", response_model=SetupStatusResponse)
+_SETUP_STEPS = [
+    "비밀번호 설정",
+    "시스템 확인",
+    "모델 선택",
+    "봇 설정",
+    "플랫폼 연동",
+    "행동 설정",
+    "음성 설정",
+    "설정 완료",
+]
+
+
+@router.get(
+    "/status",
+    response_model=None,
+    responses={200: {"model": SetupStatusResponse}},
+)
 async def get_setup_status(
     auth_service: AuthService = Depends(get_auth_service),
     config: Config = Depends(get_config),
-) -> SetupStatusResponse:
+) -> ORJSONResponse:
     """Get current setup wizard progress."""
-    steps = [
-        "비밀번호 설정",
-        "시스템 확인",
-        "모델 선택",
-        "봇 설정",
-        "플랫폼 연동",
-        "행동 설정",
-        "음성 설정",
-        "설정 완료",
-    ]
-
     # Determine current step based on what's configured
     current_step = 0
     completed = False
@@ -142,10 +169,12 @@ async def get_setup_status(
         current_step = 8
         completed = True
 
-    return SetupStatusResponse(
-        completed=completed,
-        current_step=current_step,
-        steps=steps,
+    return ORJSONResponse(
+        content={
+            "completed": completed,
+            "current_step": current_step,
+            "steps": _SETUP_STEPS,
+        }
     )
 
 
@@ -156,8 +185,12 @@ async def system_check(
     """Perform system health checks."""
     checks: list[SystemCheckResult] = []
 
+    # The Ollama probe and the disk query are independent; run them together.
+    ollama_ok, free_gb = await asyncio.gather(
+        llm_service.check_health(), _free_disk_gb()
+    )
+
     # 1. Ollama connection
-    ollama_ok = await llm_service.check_health()
     checks.append(
         SystemCheckResult(
             name="Ollama 연결",
@@ -179,9 +212,7 @@ async def system_check(
     )
 
     # 3. Disk space
-    try:
-        total, used, free = shutil.disk_usage(".")
-        free_gb = free / (1024**3)
+    if free_gb is not None:
         disk_ok = free_gb >= 1.0
         checks.append(
             SystemCheckResult(
@@ -190,7 +221,7 @@ async def system_check(
                 message=f"{free_gb:.1f}GB 사용 가능" + (" (충분함)" if disk_ok else " (1GB 이상 필요)"),
             )
         )
-    except Exception as exc:
+    else:
         checks.append(
             SystemCheckResult(
                 name="디스크 여유 공간",
@@ -202,10 +233,25 @@ async def system_check(
     return SystemCheckResponse(checks=checks)
 
 
-@router.get("/models", response_model=ModelsResponse)
+async def _free_disk_gb() -> float | None:
+    """Free space in the working directory in GB, or None if unavailable."""
+    try:
+        # statvfs blocks; keep it off the event loop.
+        usage = await run_in_threadpool(shutil.disk_usage, ".")
+    except Exception as exc:
+        logger.warning("Disk usage check failed: %s", exc)
+        return None
+    return usage.free / (1024**3)
+
+
+@router.get(
+    "/models",
+    response_model=None,
+    responses={200: {"model": ModelsResponse}},
+)
 async def get_models(
     llm_service: LLMService = Depends(get_llm_service),
-) -> ModelsResponse:
+) -> Response:
     """Get available Ollama models."""
     try:
         models_data = await llm_service.get_available_models()
@@ -217,25 +263,21 @@ async def get_models(
             )
             for m in models_data
         ]
-        return ModelsResponse(models=models)
+        result = ModelsResponse(models=models)
     except Exception as exc:
         logger.error("Failed to fetch models: %s", exc)
-        return ModelsResponse(models=[])
+        result = ModelsResponse(models=[])
+    # Already validated above; skip FastAPI's response_model re-validation.
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
-@router.post("/model")
+@router.post("/model", dependencies=[Depends(_require_setup_incomplete)])
 async def select_model(
     body: ModelSelectRequest,
     request: Request,
     config: Config = Depends(get_config),
-    auth_service: AuthService = Depends(get_auth_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Select the LLM model to use."""
-    if auth_service.is_setup_complete():
-        return JSONResponse(
-            status_code=403,
-            content={"success": False, "message": "Setup already completed. Use settings API."},
-        )
     try:
         # Update config in memory
         config.bot.model = body.model
@@ -244,28 +286,22 @@ async def select_model(
         await _save_config_to_file(config)
 
         logger.info("Model selected: %s", body.model)
-        return JSONResponse(content={"success": True, "message": "모델이 선택되었습니다."})
+        return ORJSONResponse(content={"success": True, "message": "모델이 선택되었습니다."})
     except Exception as exc:
         logger.error("Failed to save model selection: %s", exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"success": False, "message": "모델 선택 실패. 서버 로그를 확인하세요."},
         )
 
 
-@router.post("/bot")
+@router.post("/bot", dependencies=[Depends(_require_setup_incomplete)])
 async def configure_bot(
     body: BotConfigRequest,
     request: Request,
     config: Config = Depends(get_config),
-    auth_service: AuthService = Depends(get_auth_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Configure bot name and settings."""
-    if auth_service.is_setup_complete():
-        return JSONResponse(
-            status_code=403,
-            content={"success": False, "message": "Setup already completed. Use settings API."},
-        )
     try:
         config.bot.name = body.name
         config.bot.owner_name = body.owner_name
@@ -274,10 +310,10 @@ async def configure_bot(
         await _save_config_to_file(config)
 
         logger.info("Bot configured: name=%s", body.name)
-        return JSONResponse(content={"success": True, "message": "봇 설정이 저장되었습니다."})
+        return ORJSONResponse(content={"success": True, "message": "봇 설정이 저장되었습니다."})
     except Exception as exc:
         logger.error("Failed to save bot config: %s", exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"success": False, "message": "봇 설정 실패. 서버 로그를 확인하세요."},
         )
@@ -289,17 +325,17 @@ async def register_on_platform(
     request: Request,
     config: Config = Depends(get_config),
     platform_registry: PlatformRegistry = Depends(get_platform_registry),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Register a new bot on a platform and return the API key."""
     if body.platform not in ("moltbook", "botmadang"):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"success": False, "message": "지원하지 않는 플랫폼입니다."},
         )
 
     bot_name = config.bot.name
     if not bot_name or bot_name == "YourBotName":
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"success": False, "message": "먼저 봇 이름을 설정해주세요."},
         )
@@ -309,7 +345,7 @@ async def register_on_platform(
         result = await adapter.register_agent(bot_name, body.description)
 
         if not result.success:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"success": False, "message": result.error or "가입에 실패했습니다."},
             )
@@ -317,7 +353,7 @@ async def register_on_platform(
         # Save API key to .env
         if result.api_key:
             env_key = f"{body.platform.upper()}_API_KEY"
-            _persist_env_values({env_key: result.api_key})
+            await _save_env_to_file({env_key: result.api_key})
             # Update in-memory
             if body.platform == "moltbook":
                 config.env.moltbook_api_key = result.api_key
@@ -328,7 +364,7 @@ async def register_on_platform(
             await _save_config_to_file(config)
 
         logger.info("Registered bot on %s: %s", body.platform, bot_name)
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": f"{body.platform}에 가입되었습니다.",
@@ -339,26 +375,20 @@ async def register_on_platform(
         )
     except Exception as exc:
         logger.error("Registration failed on %s: %s", body.platform, exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"success": False, "message": f"가입 실패: {exc}"},
         )
 
 
-@router.post("/platforms")
+@router.post("/platforms", dependencies=[Depends(_require_setup_incomplete)])
 async def configure_platforms(
     body: PlatformsConfigRequest,
     request: Request,
     config: Config = Depends(get_config),
     platform_registry: PlatformRegistry = Depends(get_platform_registry),
-    auth_service: AuthService = Depends(get_auth_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Configure platform integrations."""
-    if auth_service.is_setup_complete():
-        return JSONResponse(
-            status_code=403,
-            content={"success": False, "message": "Setup already completed. Use settings API."},
-        )
     try:
         # Update platform configs
         config.platforms.moltbook.enabled = body.moltbook.enabled
@@ -372,35 +402,31 @@ async def configure_platforms(
             env_updates["BOTMADANG_API_KEY"] = body.botmadang.api_key
 
         if env_updates:
-            _persist_env_values(env_updates)
+            await _save_env_to_file(env_updates)
             # Update in-memory env
             if body.moltbook.api_key:
                 config.env.moltbook_api_key = body.moltbook.api_key
             if body.botmadang.api_key:
                 config.env.botmadang_api_key = body.botmadang.api_key
 
-        # Validate credentials if enabled
-        validation_results: dict[str, bool] = {}
-        if body.moltbook.enabled and body.moltbook.api_key:
-            try:
-                adapter = platform_registry.get_adapter("moltbook")
-                validation_results["moltbook"] = await adapter.validate_credentials()
-            except Exception as exc:
-                logger.warning("Moltbook validation failed: %s", exc)
-                validation_results["moltbook"] = False
-
-        if body.botmadang.enabled and body.botmadang.api_key:
-            try:
-                adapter = platform_registry.get_adapter("botmadang")
-                validation_results["botmadang"] = await adapter.validate_credentials()
-            except Exception as exc:
-                logger.warning("Botmadang validation failed: %s", exc)
-                validation_results["botmadang"] = False
+        # Validate credentials if enabled (both platforms concurrently)
+        to_validate = [
+            name
+            for name, creds in (
+                ("moltbook", body.moltbook),
+                ("botmadang", body.botmadang),
+            )
+            if creds.enabled and creds.api_key
+        ]
+        outcomes = await asyncio.gather(*(
+            _validate_platform(platform_registry, name) for name in to_validate
+        ))
+        validation_results: dict[str, bool] = dict(zip(to_validate, outcomes, strict=True))
 
         await _save_config_to_file(config)
 
         logger.info("Platform config saved: %s", validation_results)
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": "플랫폼 설정이 저장되었습니다.",
@@ -409,25 +435,19 @@ async def configure_platforms(
         )
     except Exception as exc:
         logger.error("Failed to save platform config: %s", exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"success": False, "message": "플랫폼 설정 실패. 서버 로그를 확인하세요."},
         )
 
 
-@router.post("/behavior")
+@router.post("/behavior", dependencies=[Depends(_require_setup_incomplete)])
 async def configure_behavior(
     body: BehaviorConfigRequest,
     request: Request,
     config: Config = Depends(get_config),
-    auth_service: AuthService = Depends(get_auth_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Configure bot behavior settings."""
-    if auth_service.is_setup_complete():
-        return JSONResponse(
-            status_code=403,
-            content={"success": False, "message": "Setup already completed. Use settings API."},
-        )
     try:
         config.behavior.auto_mode = body.auto_mode
         config.behavior.approval_mode = body.approval_mode
@@ -437,28 +457,22 @@ async def configure_behavior(
         await _save_config_to_file(config)
 
         logger.info("Behavior config saved")
-        return JSONResponse(content={"success": True, "message": "행동 설정이 저장되었습니다."})
+        return ORJSONResponse(content={"success": True, "message": "행동 설정이 저장되었습니다."})
     except Exception as exc:
         logger.error("Failed to save behavior config: %s", exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"success": False, "message": "행동 설정 실패. 서버 로그를 확인하세요."},
         )
 
 
-@router.post("/voice")
+@router.post("/voice", dependencies=[Depends(_require_setup_incomplete)])
 async def configure_voice(
     body: VoiceConfigRequest,
     request: Request,
     config: Config = Depends(get_config),
-    auth_service: AuthService = Depends(get_auth_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Configure voice/audio settings."""
-    if auth_service.is_setup_complete():
-        return JSONResponse(
-            status_code=403,
-            content={"success": False, "message": "Setup already completed. Use settings API."},
-        )
     try:
         config.voice.enabled = body.enabled
         config.voice.wake_word_engine = body.wake_word_engine
@@ -467,10 +481,10 @@ async def configure_voice(
         await _save_config_to_file(config)
 
         logger.info("Voice config saved")
-        return JSONResponse(content={"success": True, "message": "음성 설정이 저장되었습니다."})
+        return ORJSONResponse(content={"success": True, "message": "음성 설정이 저장되었습니다."})
     except Exception as exc:
         logger.error("Failed to save voice config: %s", exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"success": False, "message": "음성 설정 실패. 서버 로그를 확인하세요."},
         )
@@ -491,11 +505,10 @@ async def complete_setup(
         )
     try:
         # Save final config to file
-        await _save_config_to_file(config)
+        config_json = await _save_config_to_file(config)
 
-        # Save snapshot to settings_history
-        config_json = json.dumps(config.to_dict(), ensure_ascii=False, indent=2)
-        await settings_repo.save_snapshot(config_json)
+        # Save the same JSON as the settings_history snapshot
+        await settings_repo.save_snapshot(config_json.decode())
 
         logger.info("Setup wizard completed successfully")
         return SetupCompleteResponse(
@@ -515,44 +528,26 @@ async def complete_setup(
 # ------------------------------------------------------------------
 
 
-async def _save_config_to_file(config: Config) -> None:
-    """Save config object to config.json."""
-    config_path = config.config_path or Path("config.json")
-    config_dict = config.to_dict()
-
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config_dict, f, ensure_ascii=False, indent=2)
-
-
-def _persist_env_values(updates: dict[str, str]) -> None:
-    """Write or update key-value pairs in .env file."""
-    # Sanitize values to prevent newline/shell injection.
-    updates = {
-        k: v.replace("\n", "").replace("\r", "").replace("$", "").replace("`", "").replace("|", "").replace(";", "").replace(">", "").replace("<", "")
-        for k, v in updates.items()
-    }
-
-    env_path = Path(".env")
-    lines: list[str] = []
-    found_keys: set[str] = set()
-
-    if env_path.exists():
-        raw = env_path.read_text(encoding="utf-8")
-        for line in raw.splitlines():
-            # Check if this line sets one of our update keys
-            updated = False
-            for key, value in updates.items():
-                if line.startswith(f"{key}="):
-                    lines.append(f"{key}={value}")
-                    found_keys.add(key)
-                    updated = True
-                    break
-            if not updated:
-                lines.append(line)
-
-    # Append any keys that weren't found
-    for key, value in updates.items():
-        if key not in found_keys:
-            lines.append(f"{key}={value}")
-
-    env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+async def _save_config_to_file(config: Config) -> bytes:
+    """Save config object to config.json and return the JSON written."""
+    return await config.save_to_file()
+
+
+async def _validate_platform(registry: PlatformRegistry, name: str) -> bool:
+    """Check the credentials of platform *name*; False on any error."""
+    try:
+        adapter = registry.get_adapter(name)
+        return await adapter.validate_credentials()
+    except Exception as exc:
+        logger.warning("%s validation failed: %s", name.capitalize(), exc)
+        return False
+
+
+# Characters stripped from .env values to prevent newline/shell injection.
+_ENV_FORBIDDEN = str.maketrans("", "", "\n\r$`|;><")
+
+
+async def _save_env_to_file(updates: dict[str, str]) -> None:
+    """Persist *updates* to .env without blocking the event loop."""
+    sanitized = {k: v.translate(_ENV_FORBIDDEN) for k, v in updates.items()}
+    await run_in_threadpool(update_env_file, Path(".env"), sanitized)
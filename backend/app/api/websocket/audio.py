@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
@@ -12,6 +13,18 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Constant server frames, encoded once.
+_WAKE_WORD_FRAME = orjson.dumps({"type": "wake_word_detected"}).decode()
+_PONG_FRAME = orjson.dumps({"type": "pong"}).decode()
+_STATUS_LISTENING_FRAME = orjson.dumps({"type": "status", "listening": True}).decode()
+_STATUS_IDLE_FRAME = orjson.dumps({"type": "status", "listening": False}).decode()
+_CHUNK_TOO_LARGE_FRAME = orjson.dumps(
+    {
+        "type": "error",
+        "message": f"Audio chunk too large (max {MAX_WS_AUDIO_CHUNK_BYTES} bytes)",
+    }
+).decode()
+
 
 async def websocket_audio(ws: WebSocket) -> None:
     """WebSocket endpoint for audio streaming and voice commands.
@@ -72,118 +85,96 @@ async def websocket_audio(ws: WebSocket) -> None:
     await ws.accept()
     logger.info("WebSocket audio connected: session=%s...", session.session_id[:8])
 
+    # The receive loop raises WebSocketDisconnect as soon as the client goes
+    # away, and sends on a dead transport raise it too, so frames inside the
+    # loop go straight to the socket without a connection-state check.
+    send = ws.send_text
+
     try:
-        # Send initial status
-        await _send_json(
-            ws,
-            {
-                "type": "status",
-                "listening": voice_service.is_listening,
-            },
-        )
+        # Send initial status.  Later unsolicited status frames are only sent
+        # when the state differs from what the client was last told.
+        reported_listening = voice_service.is_listening
+        await send(_status_frame(reported_listening))
 
         while True:
             # Receive message (binary or text)
             message = await ws.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
 
-            # Handle binary audio data
-            if "bytes" in message:
-                audio_chunk = message["bytes"]
+            # Handle binary audio data -- the hot path, checked first
+            audio_chunk = message.get("bytes")
+            text = message.get("text")
+            if audio_chunk is not None:
                 if len(audio_chunk) > MAX_WS_AUDIO_CHUNK_BYTES:
-                    await ws.send_json({"type": "error", "message": f"Audio chunk too large (max {MAX_WS_AUDIO_CHUNK_BYTES} bytes)"})
+                    await send(_CHUNK_TOO_LARGE_FRAME)
                     continue
+                was_listening = voice_service.is_listening
                 result = await voice_service.process_audio(audio_chunk)
+                listening = voice_service.is_listening
 
                 # If we got a transcription result, send it
                 if result is not None:
-                    await _send_json(
-                        ws,
-                        {
-                            "type": "transcript",
-                            "text": result,
-                        },
-                    )
+                    await send(_transcript_frame(result))
                     # Send updated status
-                    await _send_json(
-                        ws,
-                        {
-                            "type": "status",
-                            "listening": voice_service.is_listening,
-                        },
-                    )
+                    if listening != reported_listening:
+                        reported_listening = listening
+                        await send(_status_frame(reported_listening))
 
                 # If wake word was detected, notify client
-                if voice_service.is_listening and result is None:
-                    await _send_json(
-                        ws,
-                        {
-                            "type": "wake_word_detected",
-                        },
-                    )
+                elif listening and not was_listening:
+                    await send(_WAKE_WORD_FRAME)
+                    reported_listening = True
 
             # Handle text control messages
-            elif "text" in message:
+            elif text is not None:
                 try:
-                    data = json.loads(message["text"])
+                    data = json.loads(text)
                     msg_type = data.get("type")
 
                     if msg_type == "stop":
                         # Explicitly finalize transcription
                         result = await voice_service.finalize_listening()
                         if result is not None:
-                            await _send_json(
-                                ws,
-                                {
-                                    "type": "transcript",
-                                    "text": result,
-                                },
-                            )
-                        await _send_json(
-                            ws,
-                            {
-                                "type": "status",
-                                "listening": voice_service.is_listening,
-                            },
-                        )
+                            await send(_transcript_frame(result))
+                        if voice_service.is_listening != reported_listening:
+                            reported_listening = voice_service.is_listening
+                            await send(_status_frame(reported_listening))
 
                     elif msg_type == "status":
                         # Send current status
-                        await _send_json(
-                            ws,
-                            {
-                                "type": "status",
-                                "listening": voice_service.is_listening,
-                            },
-                        )
+                        reported_listening = voice_service.is_listening
+                        await send(_status_frame(reported_listening))
 
                     elif msg_type == "ping":
                         # Keep-alive response
-                        await _send_json(ws, {"type": "pong"})
+                        await send(_PONG_FRAME)
 
                     else:
-                        await _send_error(ws, f"Unknown message type: {msg_type}")
+                        await send(_error_frame(f"Unknown message type: {msg_type}"))
 
                 except json.JSONDecodeError:
-                    await _send_error(ws, "Invalid JSON control message")
+                    await send(_error_frame("Invalid JSON control message"))
 
     except WebSocketDisconnect:
         logger.info("WebSocket audio disconnected: session=%s...", session.session_id[:8])
     except Exception as exc:
         logger.exception("WebSocket audio unexpected error: %s", exc)
         if ws.client_state == WebSocketState.CONNECTED:
-            await _send_error(ws, "Internal server error")
+            await send(_error_frame("Internal server error"))
             await ws.close(code=1011, reason="Internal error")
 
 
-async def _send_json(ws: WebSocket, data: dict) -> None:
-    """Send JSON message if connection is still open."""
-    if ws.client_state == WebSocketState.CONNECTED:
-        await ws.send_text(json.dumps(data, ensure_ascii=False))
+def _status_frame(listening: bool) -> str:
+    """Return the pre-encoded status frame for *listening*."""
+    return _STATUS_LISTENING_FRAME if listening else _STATUS_IDLE_FRAME
+
+
+def _transcript_frame(text: str) -> str:
+    """Encode a transcript frame."""
+    return orjson.dumps({"type": "transcript", "text": text}).decode()
 
 
-async def _send_error(ws: WebSocket, message: str) -> None:
-    """Send an error frame if the connection is still open."""
-    if ws.client_state == WebSocketState.CONNECTED:
-        await ws.send_text(
-            json.dumps({"type": "error", "message": message}, ensure_ascii=False)
-        )
+def _error_frame(message: str) -> str:
+    """Encode an error frame."""
+    return orjson.dumps({"type": "error", "message": message}).decode()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from collections.abc import AsyncIterator
 from typing import Any
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
@@ -18,19 +19,39 @@ logger = get_logger(__name__)
 
 _MAX_HISTORY_CONTEXT: int = 20
 
+# Streamed tokens are coalesced into one ``token`` frame until this many
+# characters are buffered or this long has passed since the last frame,
+# whichever comes first -- the time limit also applies while the model is
+# quiet between tokens.
+_TOKEN_FLUSH_CHARS: int = 256
+_TOKEN_FLUSH_SECONDS: float = 0.016
+
+# Error frames for the fixed validation messages, encoded once.
+_ERR_FRAMES: dict[str, str] = {
+    message: orjson.dumps({"type": "error", "message": message}).decode()
+    for message in (
+        f"Message too large (max {MAX_WS_MESSAGE_BYTES} bytes)",
+        "Invalid JSON",
+        "Expected a JSON object",
+        "Empty message content",
+        "Failed to generate response",
+        "Internal server error",
+    )
+}
+
 
 async def websocket_chat(ws: WebSocket) -> None:
     """WebSocket endpoint for real-time streaming chat.
 
     Protocol
     --------
-    **Client -> Server** (JSON text frames)::
+    **Client -> Server** (UTF-8 JSON in text or binary frames)::
 
         {"type": "message", "content": "Hello!", "platform": "chat"}
 
     **Server -> Client** (JSON text frames)::
 
-        {"type": "token", "content": "He"}       # repeated per token
+        {"type": "token", "content": "He"}       # repeated, one or more tokens each
         {"type": "done", "full_response": "..."}  # once at the end
         {"type": "error", "message": "..."}       # on failure
 
@@ -70,27 +91,43 @@ async def websocket_chat(ws: WebSocket) -> None:
 
     # Resolve services from app state
     llm_service: LLMService = ws.app.state.llm_service
-    db = ws.app.state.db
-    conversation_repo = ConversationRepository(db)
+    conversation_repo: ConversationRepository = ws.app.state.conversation_repo
 
     try:
         while True:
-            raw = await ws.receive_text()
-            if len(raw) > MAX_WS_MESSAGE_BYTES:
+            message = await ws.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            # Text and binary frames are both accepted; orjson parses either
+            # without a further decode.  The size limit is enforced in UTF-8
+            # bytes: a character is at least one byte, and only text that
+            # could exceed the limit at four bytes per character is encoded.
+            raw: str | bytes | None = message.get("text")
+            if raw is None:
+                raw = message.get("bytes") or b""
+            too_large = len(raw) > MAX_WS_MESSAGE_BYTES
+            if not too_large and type(raw) is str and len(raw) * 4 > MAX_WS_MESSAGE_BYTES:
+                too_large = len(raw.encode()) > MAX_WS_MESSAGE_BYTES
+            if too_large:
                 await _send_error(ws, f"Message too large (max {MAX_WS_MESSAGE_BYTES} bytes)")
                 continue
             try:
-                data: dict[str, Any] = json.loads(raw)
-            except json.JSONDecodeError:
+                data: Any = orjson.loads(raw)
+            except orjson.JSONDecodeError:
                 await _send_error(ws, "Invalid JSON")
                 continue
+            if type(data) is not dict:
+                await _send_error(ws, "Expected a JSON object")
+                continue
 
             msg_type = data.get("type")
             if msg_type != "message":
                 await _send_error(ws, f"Unknown message type: {msg_type}")
                 continue
 
-            content = data.get("content", "").strip()
+            content = data.get("content")
+            content = content.strip() if type(content) is str else ""
             if not content:
                 await _send_error(ws, "Empty message content")
                 continue
@@ -131,24 +168,66 @@ async def _handle_message(
     )
 
     # 2. Load recent history
-    recent = await conversation_repo.get_history(
+    recent = await conversation_repo.get_recent(
         limit=_MAX_HISTORY_CONTEXT,
         platform_filter=platform,
     )
-    messages: list[dict[str, str]] = []
-    for conv in reversed(recent):
-        messages.append({"role": conv.role, "content": conv.content})
+    messages = [{"role": conv.role, "content": conv.content} for conv in recent]
 
     # 3. Stream LLM response
-    full_response = ""
+    parts: list[str] = []
     try:
         stream: AsyncIterator[str] = await llm_service.chat(messages, stream=True)  # type: ignore[assignment]
 
-        async for token in stream:
-            full_response += token
-            await ws.send_text(
-                json.dumps({"type": "token", "content": token}, ensure_ascii=False)
-            )
+        loop = asyncio.get_running_loop()
+        pending: list[str] = []
+        pending_chars = 0
+        last_flush = loop.time()
+
+        # The next token is awaited as a task so a quiet model can be
+        # waited on with a deadline: buffered text is flushed when the
+        # window closes instead of sitting until the next token arrives.
+        # asyncio.wait() leaves the task running on timeout, unlike
+        # wait_for(), which would cancel the stream mid-token.
+        next_token: asyncio.Future[str] | None = None
+        try:
+            while True:
+                if next_token is None:
+                    next_token = asyncio.ensure_future(anext(stream))
+                if pending:
+                    remaining = last_flush + _TOKEN_FLUSH_SECONDS - loop.time()
+                    done, _ = await asyncio.wait((next_token,), timeout=max(remaining, 0))
+                    if not done:
+                        await _send_tokens(ws, pending)
+                        pending.clear()
+                        pending_chars = 0
+                        last_flush = loop.time()
+                        continue
+                try:
+                    token = await next_token
+                except StopAsyncIteration:
+                    next_token = None
+                    break
+                next_token = None
+
+                parts.append(token)
+                pending.append(token)
+                pending_chars += len(token)
+                now = loop.time()
+                if (
+                    pending_chars >= _TOKEN_FLUSH_CHARS
+                    or now - last_flush >= _TOKEN_FLUSH_SECONDS
+                ):
+                    await _send_tokens(ws, pending)
+                    pending.clear()
+                    pending_chars = 0
+                    last_flush = now
+        finally:
+            if next_token is not None:
+                next_token.cancel()
+
+        if pending:
+            await _send_tokens(ws, pending)
 
     except (LLMConnectionError, LLMGenerationError) as exc:
         logger.error("LLM error during streaming: %s", exc.message)
@@ -159,6 +238,8 @@ async def _handle_message(
         await _send_error(ws, "Failed to generate response")
         return
 
+    full_response = "".join(parts)
+
     # 4. Save assistant response
     if full_response:
         await conversation_repo.add(
@@ -171,10 +252,7 @@ async def _handle_message(
 
     # 5. Send completion signal
     await ws.send_text(
-        json.dumps(
-            {"type": "done", "full_response": full_response},
-            ensure_ascii=False,
-        )
+        orjson.dumps({"type": "done", "full_response": full_response}).decode()
     )
 
     logger.info(
@@ -184,9 +262,17 @@ async def _handle_message(
     )
 
 
+async def _send_tokens(ws: WebSocket, tokens: list[str]) -> None:
+    """Send buffered *tokens* as a single ``token`` frame."""
+    await ws.send_text(
+        orjson.dumps({"type": "token", "content": "".join(tokens)}).decode()
+    )
+
+
 async def _send_error(ws: WebSocket, message: str) -> None:
     """Send an error frame if the connection is still open."""
     if ws.client_state == WebSocketState.CONNECTED:
-        await ws.send_text(
-            json.dumps({"type": "error", "message": message}, ensure_ascii=False)
-        )
+        frame = _ERR_FRAMES.get(message)
+        if frame is None:
+            frame = orjson.dumps({"type": "error", "message": message}).decode()
+        await ws.send_text(frame)
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+import orjson
 from fastapi import WebSocket
 from starlette.websockets import WebSocketState
 
@@ -17,6 +17,17 @@ from app.services.auth import AuthService
 
 logger = get_logger(__name__)
 
+# Datetimes go through ``default=str`` and non-string keys are allowed, so
+# frames match what ``json.dumps(..., default=str)`` used to produce.
+_FRAME_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def encode_frame(event_type: str, data: Any) -> str:
+    """Encode a ``{"type": ..., "data": ...}`` frame for a text send."""
+    return orjson.dumps(
+        {"type": event_type, "data": data}, default=str, option=_FRAME_OPTIONS
+    ).decode()
+
 
 @dataclass
 class WebSocketConnection:
@@ -33,15 +44,18 @@ class WebSocketConnection:
 class WebSocketManager:
     """Manages active WebSocket connections with broadcast support.
 
-    Thread-safety is ensured via an ``asyncio.Lock`` that protects the
-    connections dict.  The lock is released **before** performing I/O
-    (sending messages) to avoid holding it during slow network operations.
+    Everything runs on the event loop, and every read or update of the
+    connection indexes is a synchronous step with no ``await`` inside, so
+    no lock is needed: a coroutine can never observe a half-applied change.
+    Broadcasts iterate over a snapshot so connections may come and go
+    while sends are in flight.
     """
 
     def __init__(self, auth_service: AuthService) -> None:
         self._auth_service = auth_service
         self._connections: dict[str, WebSocketConnection] = {}
-        self._lock = asyncio.Lock()
+        # session_id -> ids of its open connections, for the per-user limit.
+        self._by_session: dict[str, set[str]] = {}
 
     # ------------------------------------------------------------------
     # Connect / Disconnect
@@ -51,31 +65,40 @@ class WebSocketManager:
         self,
         websocket: WebSocket,
         session: Session | None = None,
+        initial_frame: str | None = None,
     ) -> str:
-        """Accept *websocket*, register, and return a unique connection id."""
-        # Enforce per-user connection limit.
+        """Accept *websocket*, register, and return a unique connection id.
+
+        *initial_frame* is sent before the connection is registered, so it
+        always reaches the client ahead of any broadcast.
+        """
+        connection_id = uuid.uuid4().hex
+
+        # Enforce the per-user connection limit.  The slot is reserved in the
+        # same synchronous step as the check, so concurrent handshakes for
+        # one session cannot all pass it while accept() is in flight.
         if session:
-            async with self._lock:
-                user_count = sum(
-                    1 for conn in self._connections.values()
-                    if conn.session and conn.session.session_id == session.session_id
-                )
-            if user_count >= MAX_WS_CONNECTIONS_PER_USER:
+            ids = self._by_session.setdefault(session.session_id, set())
+            if len(ids) >= MAX_WS_CONNECTIONS_PER_USER:
                 await websocket.close(code=4429, reason="Too many connections")
                 return ""
+            ids.add(connection_id)
 
-        connection_id = uuid.uuid4().hex
-        await websocket.accept()
-
-        conn = WebSocketConnection(
+        try:
+            await websocket.accept()
+            if initial_frame is not None:
+                await websocket.send_text(initial_frame)
+        except BaseException:
+            if session:
+                self._release_slot(session.session_id, connection_id)
+            raise
+
+        self._connections[connection_id] = WebSocketConnection(
             websocket=websocket,
             connection_id=connection_id,
             session=session,
         )
 
-        async with self._lock:
-            self._connections[connection_id] = conn
-
         logger.info(
             "WebSocket connected: id=%s, session=%s",
             connection_id[:8],
@@ -85,9 +108,7 @@ class WebSocketManager:
 
     async def disconnect(self, connection_id: str) -> None:
         """Remove and close the connection identified by *connection_id*."""
-        async with self._lock:
-            conn = self._connections.pop(connection_id, None)
-
+        conn = self._forget(connection_id)
         if conn is None:
             return
 
@@ -109,33 +130,30 @@ class WebSocketManager:
         Dead connections discovered during the broadcast are removed
         automatically.
         """
-        payload = json.dumps(
-            {"type": event_type, "data": data},
-            ensure_ascii=False,
-            default=str,
-        )
+        await self.broadcast_frame(encode_frame(event_type, data))
+
+    async def broadcast_frame(self, payload: str) -> None:
+        """Send an already-encoded text frame to **all** connected clients.
 
-        # Snapshot connections then release the lock before I/O.
-        async with self._lock:
-            snapshot = list(self._connections.items())
+        Sends run concurrently so one slow client does not hold up the rest.
+        """
+        # Snapshot so connections may change while sends are awaited.
+        snapshot = list(self._connections.items())
 
-        dead_connections: list[str] = []
+        if not snapshot:
+            return
 
-        for cid, conn in snapshot:
-            try:
-                if conn.websocket.client_state == WebSocketState.CONNECTED:
-                    await conn.websocket.send_text(payload)
-                else:
-                    dead_connections.append(cid)
-            except Exception:
-                logger.warning("Send failed for connection %s, marking dead", cid[:8])
-                dead_connections.append(cid)
+        results = await asyncio.gather(
+            *(self._send_frame(conn, payload) for _, conn in snapshot)
+        )
+        dead_connections = [
+            cid for (cid, _), alive in zip(snapshot, results, strict=True) if not alive
+        ]
 
         # Purge dead connections.
         if dead_connections:
-            async with self._lock:
-                for cid in dead_connections:
-                    self._connections.pop(cid, None)
+            for cid in dead_connections:
+                self._forget(cid)
             logger.info("Removed %d dead connection(s)", len(dead_connections))
 
     async def send_to(
@@ -145,25 +163,47 @@ class WebSocketManager:
         data: dict[str, Any],
     ) -> None:
         """Send a JSON message to a **single** connection."""
-        async with self._lock:
-            conn = self._connections.get(connection_id)
-
+        conn = self._connections.get(connection_id)
         if conn is None:
             return
 
-        payload = json.dumps(
-            {"type": event_type, "data": data},
-            ensure_ascii=False,
-            default=str,
-        )
+        payload = encode_frame(event_type, data)
 
         try:
             if conn.websocket.client_state == WebSocketState.CONNECTED:
                 await conn.websocket.send_text(payload)
         except Exception:
             logger.warning("send_to failed for %s, removing", connection_id[:8])
-            async with self._lock:
-                self._connections.pop(connection_id, None)
+            self._forget(connection_id)
+
+    @staticmethod
+    async def _send_frame(conn: WebSocketConnection, payload: str) -> bool:
+        """Send *payload* to *conn*; return False if the connection is dead."""
+        try:
+            if conn.websocket.client_state == WebSocketState.CONNECTED:
+                await conn.websocket.send_text(payload)
+                return True
+        except Exception:
+            logger.warning(
+                "Send failed for connection %s, marking dead",
+                conn.connection_id[:8],
+            )
+        return False
+
+    def _forget(self, connection_id: str) -> Optional[WebSocketConnection]:
+        """Drop *connection_id* from both indexes."""
+        conn = self._connections.pop(connection_id, None)
+        if conn is not None and conn.session:
+            self._release_slot(conn.session.session_id, connection_id)
+        return conn
+
+    def _release_slot(self, session_id: str, connection_id: str) -> None:
+        """Remove *connection_id* from *session_id*'s connection set."""
+        ids = self._by_session.get(session_id)
+        if ids is not None:
+            ids.discard(connection_id)
+            if not ids:
+                del self._by_session[session_id]
 
     # ------------------------------------------------------------------
     # Introspection
@@ -1,11 +1,7 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
-from typing import Any
-
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
-from starlette.websockets import WebSocketState
 
 from app.core.events import EventBus
 from app.core.logging import get_logger
@@ -23,7 +19,7 @@ from app.models.events import (
     TaskCompletedEvent,
     TaskQueuedEvent,
 )
-from app.api.websocket.manager import WebSocketManager
+from app.api.websocket.manager import WebSocketManager, encode_frame
 
 logger = get_logger(__name__)
 
@@ -42,15 +38,56 @@ _EVENT_TYPE_MAP: dict[type[Event], str] = {
     MissionCompletedEvent: "mission_complete",
 }
 
+# Immutable ``(event class, wire type)`` pairs, built once at import.
+_EVENT_ITEMS: tuple[tuple[type[Event], str], ...] = tuple(_EVENT_TYPE_MAP.items())
+
+# Initial ``state_sync`` frame, encoded once.  At this stage a full bot-state
+# service does not exist yet, so we send a reasonable skeleton that the
+# frontend can depend on.  The real values will be filled in once the bot
+# orchestrator is wired up.
+_STATE_SYNC_FRAME: str = encode_frame(
+    "state_sync",
+    {
+        "bot_status": "idle",
+        "platforms": {},
+        "uptime_seconds": 0,
+    },
+)
+
+
+def _encode_event(wire_type: str, event: Event) -> str:
+    """Return the wire frame for *event*."""
+    # orjson serialises the dataclass directly (datetimes as ISO 8601),
+    # with no intermediate asdict() copy.
+    return orjson.dumps(
+        {"type": wire_type, "data": event},
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS,
+    ).decode()
 
-def _event_to_payload(event: Event) -> dict[str, Any]:
-    """Convert a frozen dataclass event into a JSON-safe dict."""
-    d = asdict(event)
-    # Convert datetime to ISO string for JSON serialisation.
-    for key, value in d.items():
-        if hasattr(value, "isoformat"):
-            d[key] = value.isoformat()
-    return d
+
+async def subscribe_status_events(
+    event_bus: EventBus, ws_manager: WebSocketManager
+) -> None:
+    """Forward status events to every ``/ws/status`` client.
+
+    Called once at startup: each event type gets a single subscription that
+    encodes the event once and broadcasts it through *ws_manager*, instead
+    of every connection subscribing its own forwarders.
+    """
+
+    def _make_forwarder(wire_type: str):
+        async def _forward(event: Event) -> None:
+            await ws_manager.broadcast_frame(_encode_event(wire_type, event))
+
+        return _forward
+
+    await event_bus.subscribe_many(
+        [
+            (event_cls, _make_forwarder(wire_type))
+            for event_cls, wire_type in _EVENT_ITEMS
+        ]
+    )
 
 
 async def websocket_status(ws: WebSocket) -> None:
@@ -64,8 +101,9 @@ async def websocket_status(ws: WebSocket) -> None:
     ---------
     1. On connect, the server pushes a full ``state_sync`` snapshot.
     2. The server then forwards selected ``EventBus`` events for the
-       lifetime of the connection.
-    3. When the client disconnects, all event subscriptions are cleaned up.
+       lifetime of the connection, via the shared subscriptions set up by
+       :func:`subscribe_status_events`.
+    3. When the client disconnects, it is removed from the manager.
     """
 
     # -- Authentication -------------------------------------------------------
@@ -91,12 +129,16 @@ async def websocket_status(ws: WebSocket) -> None:
         await ws.close(code=4401, reason="Invalid or expired session")
         return
 
-    # -- Resolve services from app.state --------------------------------------
-    event_bus: EventBus = ws.app.state.event_bus
-    ws_manager: WebSocketManager = ws.app.state.ws_manager
-
     # -- Register connection via manager --------------------------------------
-    connection_id = await ws_manager.connect(ws, session=session)
+    # Events reach this connection through the shared forwarders registered
+    # by subscribe_status_events(); the snapshot goes out before the
+    # connection is registered so it always arrives first.
+    ws_manager: WebSocketManager = ws.app.state.ws_manager
+    connection_id = await ws_manager.connect(
+        ws, session=session, initial_frame=_STATE_SYNC_FRAME
+    )
+    if not connection_id:
+        return  # rejected by the per-user connection limit
 
     logger.info(
         "Status WS connected: connection=%s, session=%s",
@@ -104,36 +146,6 @@ async def websocket_status(ws: WebSocket) -> None:
         session.session_id[:8],
     )
 
-    # -- Send initial state snapshot ------------------------------------------
-    await _send_state_sync(ws)
-
-    # -- Subscribe to relevant EventBus events --------------------------------
-    # Build per-connection forwarding handlers so they can be cleanly removed.
-
-    async def _make_forwarder(wire_type: str):
-        """Return a handler that forwards an event to this specific WS."""
-
-        async def _forward(event: Event) -> None:
-            try:
-                if ws.client_state == WebSocketState.CONNECTED:
-                    await ws.send_text(
-                        json.dumps(
-                            {"type": wire_type, "data": _event_to_payload(event)},
-                            ensure_ascii=False,
-                            default=str,
-                        )
-                    )
-            except Exception:
-                pass  # connection dropped; disconnect loop will clean up
-
-        return _forward
-
-    handlers: list[tuple[type[Event], Any]] = []
-    for event_cls, wire_type in _EVENT_TYPE_MAP.items():
-        handler = await _make_forwarder(wire_type)
-        await event_bus.subscribe(event_cls, handler)
-        handlers.append((event_cls, handler))
-
     # -- Keep-alive loop (also receives client pings/messages) ----------------
     try:
         while True:
@@ -145,30 +157,4 @@ async def websocket_status(ws: WebSocket) -> None:
     except Exception as exc:
         logger.exception("Status WS unexpected error: %s", exc)
     finally:
-        # -- Cleanup subscriptions and connection -----------------------------
-        for event_cls, handler in handlers:
-            await event_bus.unsubscribe(event_cls, handler)
         await ws_manager.disconnect(connection_id)
-
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-async def _send_state_sync(ws: WebSocket) -> None:
-    """Push the initial ``state_sync`` payload to the client."""
-    # At this stage a full bot-state service does not exist yet, so we send
-    # a reasonable skeleton that the frontend can depend on.  The real values
-    # will be filled in once the bot orchestrator is wired up.
-    snapshot: dict[str, Any] = {
-        "bot_status": "idle",
-        "platforms": {},
-        "uptime_seconds": 0,
-    }
-
-    await ws.send_text(
-        json.dumps(
-            {"type": "state_sync", "data": snapshot},
-            ensure_ascii=False,
-        )
-    )
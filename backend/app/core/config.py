@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import ipaddress
 import json
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+import orjson
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
+from starlette.concurrency import run_in_threadpool
 
 from app.core.constants import (
     DEFAULT_BUSY_TIMEOUT_MS,
@@ -41,6 +45,7 @@ from app.core.constants import (
     DEFAULT_KOREAN_RATIO_THRESHOLD,
 )
 from app.core.exceptions import ConfigError
+from app.core.files import write_bytes_if_changed
 
 
 class BotConfig(BaseModel):
@@ -117,6 +122,43 @@ class WebSecurityConfig(BaseModel):
     max_message_length: int = DEFAULT_MAX_MESSAGE_LENGTH
     max_session_count: int = DEFAULT_MAX_SESSION_COUNT
 
+    # Derived lookups are cached per instance; hot-reload replaces the whole
+    # section object, so they never go stale.
+
+    @cached_property
+    def allowed_ip_set(self) -> frozenset[str]:
+        """``allowed_ips`` as a set for constant-time exact matches."""
+        return frozenset(self.allowed_ips)
+
+    @cached_property
+    def trusted_proxy_set(self) -> frozenset[str]:
+        """``trusted_proxies`` as a set for constant-time membership tests."""
+        return frozenset(self.trusted_proxies)
+
+    @cached_property
+    def allowed_networks(self) -> tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]:
+        """CIDR entries of ``allowed_ips`` (e.g. ``10.1.0.0/16``), parsed once."""
+        networks = []
+        for entry in self.allowed_ips:
+            if "/" not in entry:
+                continue
+            try:
+                networks.append(ipaddress.ip_network(entry, strict=False))
+            except ValueError:
+                continue
+        return tuple(networks)
+
+    @cached_property
+    def session_cookie_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for ``Response.set_cookie`` on the session cookie."""
+        return {
+            "key": "session_token",
+            "httponly": True,
+            "samesite": "lax",
+            "secure": self.https_enabled,
+            "max_age": self.session_timeout_hours * 3600,
+        }
+
 
 class SecurityConfig(BaseModel):
     blocked_keywords: list[str] = Field(default_factory=list)
@@ -214,6 +256,16 @@ class Config:
         self.env = env
         self.config_path = config_path
         self._observers: list[Callable[[str, Any, Any], Any]] = []
+        # Cached to_dict() / public_settings_json() results; None until first
+        # use and dropped whenever a section changes.
+        self._dict: Optional[dict[str, Any]] = None
+        self._public_json: Optional[bytes] = None
+        # save_to_file() bookkeeping: saves run one at a time, and a request
+        # already covered by a finished save returns its bytes.
+        self._save_lock = asyncio.Lock()
+        self._save_requested = 0
+        self._save_written = 0
+        self._last_saved = b""
 
     # ------------------------------------------------------------------
     # Singleton access
@@ -313,6 +365,7 @@ class Config:
             old_value = current.model_copy()
             new_value = model_cls(**data)
             setattr(self, section, new_value)
+            self.invalidate_cached_views()
             await self._notify_observers(section, old_value, new_value)
 
     async def reload_from_file(self) -> None:
@@ -326,7 +379,42 @@ class Config:
             if section in raw:
                 await self.update_section(section, raw[section])
 
+    async def save_to_file(self) -> bytes:
+        """Write the current configuration to ``config_path`` and return it.
+
+        Every writer of config.json goes through here.  Saves are serialised
+        and each one snapshots the config when it starts, so it also covers
+        every save requested before that point; those callers return the
+        covering write's bytes without writing again.  The newest state is
+        therefore always the last one on disk.
+        """
+        self._save_requested += 1
+        ticket = self._save_requested
+        async with self._save_lock:
+            if self._save_written >= ticket:
+                return self._last_saved
+            covered = self._save_requested
+            # Sections may have been edited in place, bypassing update_section().
+            self.invalidate_cached_views()
+            data = orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+            config_path = self.config_path or Path("config.json")
+            await run_in_threadpool(write_bytes_if_changed, config_path, data)
+            self._save_written = covered
+            self._last_saved = data
+            return data
+
     def to_dict(self) -> dict[str, Any]:
+        """Dump every persisted section to plain data.
+
+        The result is cached under the same rules as
+        :meth:`public_settings_json` and shared between callers, so treat it
+        as read-only.
+        """
+        if self._dict is None:
+            self._dict = self._dump_sections()
+        return self._dict
+
+    def _dump_sections(self) -> dict[str, Any]:
         return {
             "bot": self.bot.model_dump(),
             "platforms": self.platforms.model_dump(),
@@ -340,6 +428,31 @@ class Config:
             "memory": self.memory.model_dump(),
         }
 
+    def public_settings_json(self) -> bytes:
+        """:meth:`to_dict` as JSON, minus fields hidden from web clients.
+
+        The bytes are cached until the next :meth:`update_section`; code that
+        edits a section in place must call :meth:`invalidate_cached_views`.
+        """
+        if self._public_json is None:
+            data = dict(self.to_dict())
+            # Hide security filter rules and the CSRF secret from clients.
+            # Copy the sections first: to_dict() is shared.
+            security = dict(data["security"])
+            security.pop("blocked_keywords", None)
+            security.pop("blocked_patterns", None)
+            web_security = dict(data["web_security"])
+            web_security.pop("csrf_secret", None)
+            data["security"] = security
+            data["web_security"] = web_security
+            self._public_json = orjson.dumps(data)
+        return self._public_json
+
+    def invalidate_cached_views(self) -> None:
+        """Drop cached renderings after a section was mutated in place."""
+        self._dict = None
+        self._public_json = None
+
     # ------------------------------------------------------------------
     # Derived helpers
     # ------------------------------------------------------------------
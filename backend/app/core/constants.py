@@ -96,7 +96,7 @@ RATE_LIMIT_WINDOW_SECONDS: int = 60
 # ── Security: WebSocket ──────────────────────────────────────────────
 WS_TICKET_EXPIRY_SECONDS: int = 30
 MAX_WS_MESSAGE_BYTES: int = 8192          # 8 KB
-MAX_WS_AUDIO_CHUNK_BYTES: int = 1_048_576 # 1 MB
+MAX_WS_AUDIO_CHUNK_BYTES: int = 1_048_576 # 1 MB (uvicorn --ws-max-size in README sits 1 KB above)
 MAX_WS_CONNECTIONS_PER_USER: int = 5
 
 # ── Security: Input Validation ───────────────────────────────────────
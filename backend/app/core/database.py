@@ -130,6 +130,26 @@ class Database:
                 await self._conn.rollback()
                 raise DatabaseError(f"Transaction failed: {exc}") from exc
 
+    async def execute_write_transaction_returning(
+        self, operations: Sequence[tuple[str, tuple[Any, ...]]]
+    ) -> list[Optional[dict[str, Any]]]:
+        """Like :meth:`execute_write_transaction` for ``RETURNING`` statements.
+
+        Returns the first row produced by each operation (``None`` if none).
+        """
+        async with self._write_lock:
+            try:
+                rows: list[Optional[dict[str, Any]]] = []
+                for sql, params in operations:
+                    cursor = await self._conn.execute(sql, params)
+                    row = await cursor.fetchone()
+                    rows.append(dict(row) if row is not None else None)
+                await self._conn.commit()
+                return rows
+            except Exception as exc:
+                await self._conn.rollback()
+                raise DatabaseError(f"Transaction failed: {exc}") from exc
+
     # ------------------------------------------------------------------
     # Read operations (no lock needed under WAL)
     # ------------------------------------------------------------------
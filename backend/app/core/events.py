@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import inspect
 from collections import defaultdict
-from typing import Any, Awaitable, Callable, TypeVar
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
 
 from app.core.logging import get_logger
 from app.models.events import Event
@@ -46,6 +46,16 @@ class EventBus:
             len(self._subscribers[event_type]),
         )
 
+    async def subscribe_many(
+        self,
+        subscriptions: Sequence[tuple[type[Event], Handler]],
+    ) -> None:
+        """Register several ``(event_type, handler)`` pairs under one lock."""
+        async with self._lock:
+            for event_type, handler in subscriptions:
+                self._subscribers[event_type].append(handler)
+        logger.debug("Subscribed %d handler(s) in one batch", len(subscriptions))
+
     async def unsubscribe(
         self,
         event_type: type[T],
@@ -0,0 +1,86 @@
+"""Shared filesystem helpers."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+# Guards every read-modify-write of a dotenv file.  The writers run in
+# worker threads, so an asyncio lock would not cover all of them.
+_ENV_FILE_LOCK = threading.Lock()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace *path* with *data* without ever exposing a partial file.
+
+    The bytes go to a uniquely named temp file next to *path* in as few
+    ``write()`` calls as the OS allows, are fsynced, and the temp file is
+    renamed over *path*.  Concurrent writers therefore never share a temp
+    file.  The file is created owner-read/write only.  Blocking: call it
+    from a worker thread when on the event loop.
+    """
+    # mkstemp opens the file 0o600 and in binary mode on Windows.
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=path.name + ".", suffix=".tmp"
+    )
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    """:func:`atomic_write_bytes` unless *path* already holds exactly *data*.
+
+    Returns True if the file was written.  Comparing first turns a
+    resubmitted, unchanged config into a read instead of a temp-file write,
+    fsync and rename.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+def update_env_file(path: Path, updates: dict[str, str]) -> None:
+    """Set each ``KEY=value`` of *updates* in the dotenv file at *path*.
+
+    Lines for existing keys are replaced in place, new keys are appended
+    and every other line is kept.  Values must already be sanitised.  All
+    callers share one lock, so concurrent updates never drop each other's
+    keys.  Blocking: call it from a worker thread when on the event loop.
+    """
+    with _ENV_FILE_LOCK:
+        lines: list[str] = []
+        found_keys: set[str] = set()
+
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                key = line.partition("=")[0] if "=" in line else None
+                if key in updates:
+                    lines.append(f"{key}={updates[key]}")
+                    found_keys.add(key)
+                else:
+                    lines.append(line)
+
+        for key, value in updates.items():
+            if key not in found_keys:
+                lines.append(f"{key}={value}")
+
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -0,0 +1,21 @@
+-- Indexes for the notifications list view: every query orders by timestamp
+-- with a LIMIT, so each filter gets an index that yields rows already in
+-- timestamp order instead of sorting the whole table.
+
+-- platform + unread (oldest first), supersedes idx_notification_log_platform_read
+CREATE INDEX IF NOT EXISTS idx_notification_log_platform_read_ts
+    ON notification_log(platform, is_read, timestamp);
+
+DROP INDEX IF EXISTS idx_notification_log_platform_read;
+
+-- platform only (newest first), also serves MAX(timestamp) per platform
+CREATE INDEX IF NOT EXISTS idx_notification_log_platform_ts
+    ON notification_log(platform, timestamp);
+
+-- unread across all platforms (newest first)
+CREATE INDEX IF NOT EXISTS idx_notification_log_unread_ts
+    ON notification_log(timestamp) WHERE is_read = 0;
+
+-- everything (newest first)
+CREATE INDEX IF NOT EXISTS idx_notification_log_ts
+    ON notification_log(timestamp);
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import ipaddress
-from typing import Sequence
+from typing import Collection
 
-from starlette.requests import Request
+from starlette.requests import HTTPConnection
+from starlette.types import Scope
 
 from app.core.constants import TRUSTED_INTERNAL_NETWORKS
 from app.core.logging import get_logger
@@ -19,8 +20,8 @@ _INTERNAL_NETS: tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...] = tupl
 
 
 def get_client_ip(
-    request: Request,
-    trusted_proxies: Sequence[str] = (),
+    request: HTTPConnection,
+    trusted_proxies: Collection[str] = (),
 ) -> str:
     """Return the real client IP address.
 
@@ -28,20 +29,38 @@ def get_client_ip(
     (``request.client.host``) comes from a known trusted proxy.
     When untrusted, the header is ignored entirely.
     """
-    direct_ip = request.client.host if request.client else "unknown"
+    return get_client_ip_from_scope(request.scope, trusted_proxies)
 
-    forwarded = request.headers.get("x-forwarded-for")
-    if not forwarded:
-        return direct_ip
+
+def get_client_ip_from_scope(
+    scope: Scope,
+    trusted_proxies: Collection[str] = (),
+) -> str:
+    """Scope-level :func:`get_client_ip` for ASGI middleware.
+
+    Reads the peer address and ``X-Forwarded-For`` straight from the ASGI
+    scope without building a ``Request`` or ``Headers``.  Pass a set for
+    *trusted_proxies* to make each membership test constant-time.
+    """
+    client = scope.get("client")
+    direct_ip = client[0] if client else "unknown"
 
     # Only honour the header when the direct peer is a trusted proxy.
     if direct_ip not in trusted_proxies:
         return direct_ip
 
+    forwarded: bytes | None = None
+    for name, value in scope["headers"]:
+        if name == b"x-forwarded-for":
+            forwarded = value
+            break
+    if not forwarded:
+        return direct_ip
+
     # Use the *rightmost* entry that is NOT a known proxy.
     # This is the safest strategy when proxies append to the header.
-    parts = [p.strip() for p in forwarded.split(",")]
-    for ip_str in reversed(parts):
+    for part in reversed(forwarded.decode("latin-1").split(",")):
+        ip_str = part.strip()
         if ip_str not in trusted_proxies:
             return ip_str
 
@@ -49,6 +68,24 @@ def get_client_ip(
     return direct_ip
 
 
+def resolve_client_ip(
+    scope: Scope,
+    trusted_proxies: Collection[str] = (),
+) -> str:
+    """Memoised :func:`get_client_ip_from_scope`.
+
+    The result is stored in the per-request state (``request.state.client_ip``)
+    so the security middleware and route handlers resolve it only once.
+    """
+    state = scope.setdefault("state", {})
+    client_ip = state.get("client_ip")
+    if client_ip is None:
+        client_ip = state["client_ip"] = get_client_ip_from_scope(
+            scope, trusted_proxies
+        )
+    return client_ip
+
+
 def is_private_ip(ip_str: str) -> bool:
     """Return ``True`` if *ip_str* belongs to a private / loopback range."""
     try:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -7,7 +8,7 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.api.middleware import register_middleware
 from app.api.routes.activities import router as activities_router
@@ -25,7 +26,7 @@ from app.api.routes.setup_wizard import router as setup_wizard_router
 from app.api.websocket.audio import websocket_audio
 from app.api.websocket.chat import websocket_chat
 from app.api.websocket.manager import WebSocketManager
-from app.api.websocket.status import websocket_status
+from app.api.websocket.status import subscribe_status_events, websocket_status
 from app.core.config import Config
 from app.core.database import Database
 from app.core.events import EventBus
@@ -36,7 +37,9 @@ from app.core.security import SecurityFilter
 from app.core.task_queue import TaskQueue
 from app.platforms.registry import PlatformRegistry
 from app.repositories.activity import ActivityRepository
+from app.repositories.conversation import ConversationRepository
 from app.repositories.notification import NotificationRepository
+from app.repositories.settings import SettingsRepository
 from app.services.auth import AuthService
 from app.services.backup import BackupService
 from app.services.feed_monitor import FeedMonitor
@@ -78,7 +81,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # -- Startup -------------------------------------------------------------
     setup_logging()
-    logger.info("Starting bara_system backend")
+    # Surfaces a silent fallback from uvloop to the stock asyncio loop.
+    logger.info(
+        "Starting bara_system backend (event loop: %s)",
+        type(asyncio.get_running_loop()).__module__,
+    )
 
     config = Config.from_file()
     db = await Database.initialize(config.db_path)
@@ -130,9 +137,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # -- Task queue ------------------------------------------------------------
     task_queue = TaskQueue(rate_limiters)
 
-    # -- Repositories for automation services ----------------------------------
+    # -- Repositories (shared by automation services and API dependencies) -----
     activity_repo = ActivityRepository(db)
     notification_repo = NotificationRepository(db)
+    conversation_repo = ConversationRepository(db)
+    settings_repo = SettingsRepository(db)
 
     # -- Automation services ---------------------------------------------------
     feed_monitor = FeedMonitor(
@@ -275,6 +284,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await event_bus.subscribe(BotResponseGeneratedEvent, auto_capture.on_bot_response)
     await event_bus.subscribe(NotificationReceivedEvent, auto_capture.on_notification_for_capture)
 
+    # Forward status events to /ws/status clients
+    await subscribe_status_events(event_bus, ws_manager)
+
     # -- Voice service (optional, only if enabled) -----------------------------
     voice_service = VoiceService(config=config, event_bus=event_bus)
     if voice_service.is_enabled:
@@ -312,6 +324,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.embedding_service = embedding_service
     app.state.auto_capture = auto_capture
     app.state.example_evaluator = example_evaluator
+    app.state.activity_repo = activity_repo
+    app.state.notification_repo = notification_repo
+    app.state.conversation_repo = conversation_repo
+    app.state.collected_info_repo = collected_info_repo
+    app.state.settings_repo = settings_repo
     app.state.good_example_repo = good_example_repo
     app.state.memory_facade = memory_facade
     app.state.memory_store_repo = memory_store_repo
@@ -366,6 +383,7 @@ def create_app() -> FastAPI:
         title="bara_system",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS (outermost middleware -- added first so it wraps everything)
@@ -397,8 +415,8 @@ def create_app() -> FastAPI:
     # -- Health endpoint (no auth required) ----------------------------------
 
     @app.get("/api/health")
-    async def health_check() -> JSONResponse:
-        return JSONResponse(
+    async def health_check() -> ORJSONResponse:
+        return ORJSONResponse(
             content={
                 "status": "healthy",
                 "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
+
+import orjson
 
 from app.core.config import Config
 from app.core.http_client import HttpClient
@@ -39,6 +41,8 @@ class PlatformRegistry:
         self._rate_limiters = rate_limiters
         self._security_filter = security_filter
         self._adapters: dict[str, PlatformAdapter] = {}
+        # ((name, authenticated) pairs, JSON body) of the last status rendering.
+        self._status_json: Optional[tuple[tuple[tuple[str, bool], ...], bytes]] = None
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -125,3 +129,17 @@ class PlatformRegistry:
             }
 
         return summary
+
+    def get_status_summary_json(self) -> bytes:
+        """:meth:`get_status_summary` as JSON, re-rendered only on change.
+
+        The adapter set is fixed after :meth:`initialize` and capabilities
+        are per-class constants, so authentication state is the only input
+        that can change between polls.
+        """
+        key = tuple((n, a.is_authenticated) for n, a in self._adapters.items())
+        cached = self._status_json
+        if cached is None or cached[0] != key:
+            cached = (key, orjson.dumps(self.get_status_summary()))
+            self._status_json = cached
+        return cached[1]
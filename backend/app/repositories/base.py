@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import time
 from typing import Any, Optional
 
 from app.core.database import Database
 
+# Pagination totals are re-requested with every page; memoise them briefly.
+_COUNT_CACHE_TTL_SECONDS = 2.0
+_COUNT_CACHE_MAX_ENTRIES = 256
+
 
 class BaseRepository:
     """Thin convenience wrapper around :class:`Database`.
@@ -16,6 +21,8 @@ class BaseRepository:
 
     def __init__(self, db: Database) -> None:
         self._db = db
+        # (sql, params) -> (monotonic expiry, count)
+        self._count_cache: dict[tuple[str, tuple[Any, ...]], tuple[float, int]] = {}
 
     # ------------------------------------------------------------------
     # Delegated helpers
@@ -35,3 +42,29 @@ class BaseRepository:
         self, sql: str, params: tuple[Any, ...] = ()
     ) -> list[dict[str, Any]]:
         return await self._db.fetch_all(sql, params)
+
+    # ------------------------------------------------------------------
+    # Cached counts
+    # ------------------------------------------------------------------
+
+    async def cached_count(self, sql: str, params: tuple[Any, ...] = ()) -> int:
+        """Run a ``SELECT COUNT(*) AS cnt`` query, memoised for a short TTL.
+
+        Bursts of identical pagination requests share one count.  Writes made
+        through the repository should call :meth:`_invalidate_counts`.
+        """
+        key = (sql, params)
+        now = time.monotonic()
+        cached = self._count_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        row = await self.fetch_one(sql, params)
+        count = row["cnt"] if row else 0
+        if len(self._count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+            self._count_cache.clear()
+        self._count_cache[key] = (now + _COUNT_CACHE_TTL_SECONDS, count)
+        return count
+
+    def _invalidate_counts(self) -> None:
+        self._count_cache.clear()
@@ -50,6 +50,7 @@ class CollectedInfoRepository(BaseRepository):
             "SELECT * FROM collected_info WHERE id = ?", (row_id,)
         )
         assert row is not None
+        self._invalidate_counts()
         return CollectedInfo(**row)
 
     async def get_by_id(self, id: int) -> Optional[CollectedInfo]:
@@ -69,6 +70,7 @@ class CollectedInfoRepository(BaseRepository):
         await self.execute_write(
             "DELETE FROM collected_info WHERE id = ?", (id,)
         )
+        self._invalidate_counts()
         return True
 
     # ------------------------------------------------------------------
@@ -83,6 +85,34 @@ class CollectedInfoRepository(BaseRepository):
         limit: int = 50,
         offset: int = 0,
     ) -> list[CollectedInfo]:
+        where, params = self._search_filter(query, category, bookmarked_only)
+        sql = (
+            f"SELECT * FROM collected_info {where} "
+            "ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+        )
+        params.extend([limit, offset])
+
+        rows = await self.fetch_all(sql, tuple(params))
+        return [CollectedInfo(**r) for r in rows]
+
+    async def count_search(
+        self,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        bookmarked_only: bool = False,
+    ) -> int:
+        """Total rows matched by :meth:`search` (briefly cached)."""
+        where, params = self._search_filter(query, category, bookmarked_only)
+        return await self.cached_count(
+            f"SELECT COUNT(*) AS cnt FROM collected_info {where}", tuple(params)
+        )
+
+    @staticmethod
+    def _search_filter(
+        query: Optional[str],
+        category: Optional[str],
+        bookmarked_only: bool,
+    ) -> tuple[str, list[object]]:
         conditions: list[str] = []
         params: list[object] = []
 
@@ -101,15 +131,7 @@ class CollectedInfoRepository(BaseRepository):
         where = ""
         if conditions:
             where = "WHERE " + " AND ".join(conditions)
-
-        sql = (
-            f"SELECT * FROM collected_info {where} "
-            "ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-        )
-        params.extend([limit, offset])
-
-        rows = await self.fetch_all(sql, tuple(params))
-        return [CollectedInfo(**r) for r in rows]
+        return where, params
 
     async def toggle_bookmark(self, id: int) -> bool:
         """Toggle the bookmark flag and return the new state."""
@@ -123,6 +145,7 @@ class CollectedInfoRepository(BaseRepository):
             "UPDATE collected_info SET bookmarked = ? WHERE id = ?",
             (new_state, id),
         )
+        self._invalidate_counts()
         return new_state
 
     async def get_categories(self) -> list[str]:
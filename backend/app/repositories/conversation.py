@@ -12,15 +12,19 @@ class ConversationRepository(BaseRepository):
     _table_name = "conversations"
 
     async def add(self, item: ConversationCreate) -> Conversation:
-        row_id = await self.execute_write(
-            "INSERT INTO conversations (role, content, platform) "
-            "VALUES (?, ?, ?)",
-            (item.role, item.content, item.platform),
-        )
-        row = await self.fetch_one(
-            "SELECT * FROM conversations WHERE id = ?", (row_id,)
-        )
+        # RETURNING hands back the stored row from the write itself, so a
+        # turn costs one statement on the shared connection instead of an
+        # INSERT followed by a separate SELECT.
+        rows = await self._db.execute_write_transaction_returning([
+            (
+                "INSERT INTO conversations (role, content, platform) "
+                "VALUES (?, ?, ?) RETURNING *",
+                (item.role, item.content, item.platform),
+            )
+        ])
+        row = rows[0]
         assert row is not None
+        self._invalidate_counts()
         return Conversation(**row)
 
     async def get_by_id(self, id: int) -> Optional[Conversation]:
@@ -40,6 +44,7 @@ class ConversationRepository(BaseRepository):
         await self.execute_write(
             "DELETE FROM conversations WHERE id = ?", (id,)
         )
+        self._invalidate_counts()
         return True
 
     async def get_history(
@@ -48,22 +53,51 @@ class ConversationRepository(BaseRepository):
         offset: int = 0,
         platform_filter: Optional[str] = None,
     ) -> list[Conversation]:
-        conditions: list[str] = []
-        params: list[object] = []
+        where, params = self._history_filter(platform_filter)
+        sql = (
+            f"SELECT * FROM conversations {where} "
+            "ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+        )
+        params.extend([limit, offset])
 
-        if platform_filter is not None:
-            conditions.append("platform = ?")
-            params.append(platform_filter)
+        rows = await self.fetch_all(sql, tuple(params))
+        return [Conversation(**r) for r in rows]
 
+    async def count_history(self, platform_filter: Optional[str] = None) -> int:
+        """Total rows matched by :meth:`get_history` (briefly cached)."""
+        where, params = self._history_filter(platform_filter)
+        return await self.cached_count(
+            f"SELECT COUNT(*) AS cnt FROM conversations {where}", tuple(params)
+        )
+
+    @staticmethod
+    def _history_filter(platform_filter: Optional[str]) -> tuple[str, list[object]]:
+        if platform_filter is None:
+            return "", []
+        return "WHERE platform = ?", [platform_filter]
+
+    async def get_recent(
+        self,
+        limit: int,
+        platform_filter: Optional[str] = None,
+    ) -> list[Conversation]:
+        """Return the latest *limit* messages in chronological order.
+
+        Suited to building LLM context: SQLite picks the newest rows and
+        returns them oldest-first, so callers need not reverse the list.
+        """
         where = ""
-        if conditions:
-            where = "WHERE " + " AND ".join(conditions)
+        params: list[object] = []
+        if platform_filter is not None:
+            where = "WHERE platform = ?"
+            params.append(platform_filter)
+        params.append(limit)
 
         sql = (
+            "SELECT * FROM ("
             f"SELECT * FROM conversations {where} "
-            "ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+            "ORDER BY timestamp DESC, id DESC LIMIT ?"
+            ") ORDER BY timestamp ASC, id ASC"
         )
-        params.extend([limit, offset])
-
         rows = await self.fetch_all(sql, tuple(params))
         return [Conversation(**r) for r in rows]
@@ -105,6 +105,45 @@ class MissionRepository(BaseRepository):
         )
         return [self._row_to_model(r) for r in rows]
 
+    async def get_page(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        status: Optional[str] = None,
+    ) -> tuple[list[Mission], int]:
+        """Return one page of missions plus the total matching row count.
+
+        The total rides along on every row via ``COUNT(*) OVER()``, so a page
+        costs one query instead of a SELECT followed by a COUNT.
+        """
+        where = ""
+        params: list[object] = []
+        if status is not None:
+            where = "WHERE status = ?"
+            params.append(status)
+
+        rows = await self.fetch_all(
+            f"SELECT *, COUNT(*) OVER() AS _total FROM missions {where} "
+            "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        )
+        if rows:
+            total = rows[0]["_total"]
+        elif offset:
+            # Past the last page: no row to carry the total, so ask directly.
+            row = await self.fetch_one(
+                f"SELECT COUNT(*) AS cnt FROM missions {where}", tuple(params)
+            )
+            total = row["cnt"] if row else 0
+        else:
+            total = 0
+
+        missions = []
+        for row in rows:
+            del row["_total"]
+            missions.append(self._row_to_model(row))
+        return missions, total
+
     async def count(self) -> int:
         row = await self.fetch_one("SELECT COUNT(*) as cnt FROM missions")
         return row["cnt"] if row else 0
@@ -127,6 +166,29 @@ class MissionRepository(BaseRepository):
                 (status, mission_id),
             )
 
+    async def close_if_open(self, mission_id: int, status: str) -> bool:
+        """Move a mission to terminal *status* unless it already is terminal.
+
+        Check and write happen in one guarded UPDATE.  Returns False when the
+        mission is missing or already complete/cancelled.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        rows = await self._db.execute_write_transaction_returning([
+            (
+                "UPDATE missions SET status = ?, completed_at = ? "
+                "WHERE id = ? AND status NOT IN ('complete', 'cancelled') "
+                "RETURNING id",
+                (status, now, mission_id),
+            )
+        ])
+        return rows[0] is not None
+
+    async def get_status(self, mission_id: int) -> Optional[str]:
+        row = await self.fetch_one(
+            "SELECT status FROM missions WHERE id = ?", (mission_id,)
+        )
+        return row["status"] if row else None
+
     async def increment_warmup(self, mission_id: int) -> int:
         """Increment warmup_count and return the new value."""
         await self.execute_write(
@@ -3,9 +3,33 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
+from pydantic import TypeAdapter
+
 from app.models.notification import NotificationCreate, NotificationLog
 from app.repositories.base import BaseRepository
 
+# Listing statements are fixed strings so sqlite3's per-connection statement
+# cache (keyed on SQL text) can reuse the compiled statement on every call.
+_UNPROCESSED_BY_PLATFORM = (
+    "SELECT * FROM notification_log "
+    "WHERE platform = ? AND is_read = 0 "
+    "AND response_activity_id IS NULL "
+    "ORDER BY timestamp ASC LIMIT ?"
+)
+_LIST_BY_PLATFORM = (
+    "SELECT * FROM notification_log WHERE platform = ? "
+    "ORDER BY timestamp DESC LIMIT ?"
+)
+_LIST_UNREAD = (
+    "SELECT * FROM notification_log WHERE is_read = 0 "
+    "ORDER BY timestamp DESC LIMIT ?"
+)
+_LIST_ALL = "SELECT * FROM notification_log ORDER BY timestamp DESC LIMIT ?"
+
+# Validates a whole result set in one pydantic-core call.  Rows still need
+# validation: SQLite hands back text timestamps and 0/1 for is_read.
+_LOGS_ADAPTER = TypeAdapter(list[NotificationLog])
+
 
 class NotificationRepository(BaseRepository):
     """CRUD and query helpers for the ``notification_log`` table."""
@@ -56,15 +80,41 @@ class NotificationRepository(BaseRepository):
     # Domain-specific queries
     # ------------------------------------------------------------------
 
-    async def get_unprocessed(self, platform: str) -> list[NotificationLog]:
+    async def get_unprocessed(
+        self, platform: str, limit: Optional[int] = None
+    ) -> list[NotificationLog]:
+        """Unread, unanswered notifications for *platform*, oldest first.
+
+        *limit* is applied in SQL; ``None`` returns every match.
+        """
+        # SQLite treats a negative LIMIT as "no limit".
         rows = await self.fetch_all(
-            "SELECT * FROM notification_log "
-            "WHERE platform = ? AND is_read = 0 "
-            "AND response_activity_id IS NULL "
-            "ORDER BY timestamp ASC",
-            (platform,),
+            _UNPROCESSED_BY_PLATFORM,
+            (platform, -1 if limit is None else limit),
         )
-        return [NotificationLog(**r) for r in rows]
+        return _LOGS_ADAPTER.validate_python(rows)
+
+    async def list_recent(
+        self,
+        limit: int,
+        platform: Optional[str] = None,
+        unread_only: bool = False,
+    ) -> list[NotificationLog]:
+        """Return up to *limit* entries for the notifications list view.
+
+        With both *platform* and *unread_only* this is the head of
+        :meth:`get_unprocessed` (oldest first); otherwise newest first.
+        """
+        if platform and unread_only:
+            return await self.get_unprocessed(platform, limit)
+        if platform:
+            sql, params = _LIST_BY_PLATFORM, (platform, limit)
+        elif unread_only:
+            sql, params = _LIST_UNREAD, (limit,)
+        else:
+            sql, params = _LIST_ALL, (limit,)
+        rows = await self.fetch_all(sql, params)
+        return _LOGS_ADAPTER.validate_python(rows)
 
     async def mark_responded(
         self, id: int, response_activity_id: int
@@ -76,6 +126,21 @@ class NotificationRepository(BaseRepository):
             (response_activity_id, id),
         )
 
+    async def mark_read(self, id: int) -> bool:
+        """Mark *id* read (``response_activity_id = 0``) in one statement.
+
+        Returns False if no such notification exists.
+        """
+        rows = await self._db.execute_write_transaction_returning([
+            (
+                "UPDATE notification_log "
+                "SET is_read = 1, response_activity_id = 0 "
+                "WHERE id = ? RETURNING id",
+                (id,),
+            )
+        ])
+        return rows[0] is not None
+
     async def get_last_check_time(
         self, platform: str
     ) -> Optional[datetime]:
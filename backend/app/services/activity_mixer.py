@@ -11,6 +11,7 @@ from app.core.constants import (
     ACTIVITY_WEIGHT_UPVOTE,
 )
 from app.core.logging import get_logger
+from app.models.mission import MissionStatus
 
 if TYPE_CHECKING:
     from app.models.mission import Mission
@@ -91,7 +92,6 @@ class ActivityMixer:
 
         # Check for active missions that need posting
         if active_missions:
-            from app.models.mission import MissionStatus
             active_ready = [
                 m for m in active_missions
                 if m.status == MissionStatus.ACTIVE
@@ -162,7 +162,6 @@ class ActivityMixer:
                 post, active_missions
             )
             if related_mission is not None:
-                from app.models.mission import MissionStatus
                 if related_mission.status == MissionStatus.WARMUP:
                     weights["warmup"] = ACTIVITY_WEIGHT_COMMENT * 0.8
                     # Reduce other weights slightly
@@ -4,6 +4,7 @@ import hashlib
 import os
 import secrets
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -15,6 +16,7 @@ from app.core.constants import (
     WS_TICKET_EXPIRY_SECONDS,
 )
 from app.core.database import Database
+from app.core.files import update_env_file
 from app.core.logging import get_logger
 from app.models.auth import Session
 
@@ -49,10 +51,11 @@ class AuthService:
 
         # session_token -> Session
         self._sessions: dict[str, Session] = {}
-        # ip -> list of unix-epoch timestamps of failed attempts
-        self._login_attempts: dict[str, list[float]] = {}
-        # WebSocket one-time tickets: ticket_str -> (session, expiry_timestamp)
-        self._ws_tickets: dict[str, tuple[Session, float]] = {}
+        # ip -> (failed-attempt count, unix-epoch expiry of the lockout window)
+        self._login_attempts: dict[str, tuple[int, float]] = {}
+        # WebSocket one-time tickets: ticket_str -> (session, monotonic expiry).
+        # Every ticket has the same lifetime, so insertion order is expiry order.
+        self._ws_tickets: OrderedDict[str, tuple[Session, float]] = OrderedDict()
 
     # ------------------------------------------------------------------
     # Password hashing
@@ -77,6 +80,7 @@ class AuthService:
         try:
             salt_hex, expected_hex = stored_hash.split(":", 1)
             salt = bytes.fromhex(salt_hex)
+            expected = bytes.fromhex(expected_hex)
         except (ValueError, IndexError):
             return False
         dk = hashlib.pbkdf2_hmac(
@@ -85,7 +89,8 @@ class AuthService:
             salt,
             _HASH_ITERATIONS,
         )
-        return secrets.compare_digest(dk.hex(), expected_hex)
+        # Compare raw digests: fixed length, no data-dependent early exit.
+        return secrets.compare_digest(dk, expected)
 
     # ------------------------------------------------------------------
     # Password management
@@ -162,25 +167,32 @@ class AuthService:
     # ------------------------------------------------------------------
 
     def record_login_attempt(self, ip: str, success: bool) -> None:
-        """Record a login attempt.  Successful attempts clear the history."""
+        """Record a login attempt.  Successful attempts clear the history.
+
+        Failures are counted in a fixed window that opens on the first
+        failure and lasts ``lockout_minutes``, so each call is O(1).
+        """
         if success:
             self._login_attempts.pop(ip, None)
             return
-        attempts = self._login_attempts.setdefault(ip, [])
-        attempts.append(time.time())
+        now = time.time()
+        entry = self._login_attempts.get(ip)
+        if entry is None or entry[1] <= now:
+            lockout_seconds = self._config.web_security.lockout_minutes * 60
+            self._login_attempts[ip] = (1, now + lockout_seconds)
+        else:
+            self._login_attempts[ip] = (entry[0] + 1, entry[1])
 
     def is_locked_out(self, ip: str) -> bool:
         """Return True when *ip* has exceeded the allowed login attempts."""
-        max_attempts = self._config.web_security.max_login_attempts
-        lockout_seconds = self._config.web_security.lockout_minutes * 60
-        attempts = self._login_attempts.get(ip)
-        if not attempts:
+        entry = self._login_attempts.get(ip)
+        if entry is None:
             return False
-        cutoff = time.time() - lockout_seconds
-        recent = [t for t in attempts if t > cutoff]
-        # keep only recent entries
-        self._login_attempts[ip] = recent
-        return len(recent) >= max_attempts
+        count, expires_at = entry
+        if expires_at <= time.time():
+            del self._login_attempts[ip]
+            return False
+        return count >= self._config.web_security.max_login_attempts
 
     # ------------------------------------------------------------------
     # .env persistence helper
@@ -189,24 +201,7 @@ class AuthService:
     @staticmethod
     def _persist_env_value(key: str, value: str) -> None:
         """Write or update *key=value* in the ``.env`` file."""
-        value = _sanitize_env_value(value)
-        env_path = Path(".env")
-        lines: list[str] = []
-        found = False
-
-        if env_path.exists():
-            raw = env_path.read_text(encoding="utf-8")
-            for line in raw.splitlines():
-                if line.startswith(f"{key}="):
-                    lines.append(f"{key}={value}")
-                    found = True
-                else:
-                    lines.append(line)
-
-        if not found:
-            lines.append(f"{key}={value}")
-
-        env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        update_env_file(Path(".env"), {key: _sanitize_env_value(value)})
 
     # ------------------------------------------------------------------
     # Session cleanup
@@ -215,7 +210,6 @@ class AuthService:
     def cleanup_expired_sessions(self) -> int:
         """Remove all expired sessions and tickets. Returns count removed."""
         now_utc = datetime.now(timezone.utc)
-        now_ts = now_utc.timestamp()
 
         expired_sessions = [
             k for k, s in self._sessions.items() if now_utc > s.expires_at
@@ -223,13 +217,9 @@ class AuthService:
         for key in expired_sessions:
             self._sessions.pop(key, None)
 
-        expired_tickets = [
-            k for k, (_, exp) in self._ws_tickets.items() if now_ts > exp
-        ]
-        for key in expired_tickets:
-            self._ws_tickets.pop(key, None)
+        expired_tickets = self._prune_ws_tickets(time.monotonic())
 
-        total = len(expired_sessions) + len(expired_tickets)
+        total = len(expired_sessions) + expired_tickets
         if total:
             logger.debug("Cleaned up %d expired sessions/tickets", total)
         return total
@@ -282,9 +272,11 @@ class AuthService:
         session = self.validate_session(session_token)
         if session is None:
             return None
+        now = time.monotonic()
+        # Unused tickets would otherwise accumulate until the next cleanup.
+        self._prune_ws_tickets(now)
         ticket = secrets.token_urlsafe(32)
-        expiry = datetime.now(timezone.utc).timestamp() + WS_TICKET_EXPIRY_SECONDS
-        self._ws_tickets[ticket] = (session, expiry)
+        self._ws_tickets[ticket] = (session, now + WS_TICKET_EXPIRY_SECONDS)
         return ticket
 
     def validate_ws_ticket(self, ticket: str) -> Session | None:
@@ -296,9 +288,25 @@ class AuthService:
         if entry is None:
             return None
         session, expiry = entry
-        if datetime.now(timezone.utc).timestamp() > expiry:
+        if time.monotonic() > expiry:
             return None
         # Also verify the underlying session is still valid.
         if self.validate_session(session.session_id) is None:
             return None
         return session
+
+    def _prune_ws_tickets(self, now: float) -> int:
+        """Drop expired tickets from the front of the store; return the count.
+
+        Tickets expire in insertion order, so this stops at the first live
+        one and costs O(1) amortised per ticket.
+        """
+        tickets = self._ws_tickets
+        removed = 0
+        while tickets:
+            first = next(iter(tickets))
+            if tickets[first][1] >= now:
+                break
+            del tickets[first]
+            removed += 1
+        return removed
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import TYPE_CHECKING
 
 from app.core.constants import ActivityStatus, ActivityType
 from app.core.logging import get_logger
 from app.core.task_queue import PRIORITY_SCHEDULED, QueuedTask
-from app.models.activity import ActivityCreate
+from app.models.activity import ActivityCreate, DailyLimits
 from app.models.events import CommentPostedEvent, NewPostDiscoveredEvent
+from app.services.strategy import StrategyContext
 
 if TYPE_CHECKING:
     from app.core.config import Config
@@ -184,10 +185,6 @@ class FeedMonitor:
 
     async def _build_strategy_context(self, platform: str):
         """Build a StrategyContext for ActivityMixer."""
-        from datetime import date
-        from app.models.activity import DailyCounts, DailyLimits
-        from app.services.strategy import StrategyContext
-
         today = date.today()
         daily_counts = await self._activity_repo.get_daily_counts(platform, today)
         behavior = self._config.behavior
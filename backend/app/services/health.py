@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import shutil
 import time
@@ -13,6 +14,7 @@ from app.core.logging import get_logger
 if TYPE_CHECKING:
     from app.core.config import Config
     from app.core.database import Database
+    from app.platforms.base import PlatformAdapter
     from app.platforms.registry import PlatformRegistry
     from app.services.llm import LLMService
 
@@ -57,8 +59,14 @@ class HealthMonitor:
         has_critical_failure = False
         has_warning = False
 
+        # The network-bound checks are independent; run them concurrently.
+        ollama_ok, db_ok, platform_checks = await asyncio.gather(
+            self._check_ollama(),
+            self._check_database(),
+            self._check_platforms(),
+        )
+
         # 1. Ollama / LLM health
-        ollama_ok = await self._check_ollama()
         checks.append({
             "name": "ollama",
             "status": "ok" if ollama_ok else "fail",
@@ -68,7 +76,6 @@ class HealthMonitor:
             has_critical_failure = True
 
         # 2. Database health
-        db_ok = await self._check_database()
         checks.append({
             "name": "database",
             "status": "ok" if db_ok else "fail",
@@ -78,7 +85,6 @@ class HealthMonitor:
             has_critical_failure = True
 
         # 3. Platform health
-        platform_checks = await self._check_platforms()
         for pc in platform_checks:
             checks.append(pc)
             if pc["status"] == "fail":
@@ -144,27 +150,31 @@ class HealthMonitor:
             return False
 
     async def _check_platforms(self) -> list[dict[str, Any]]:
-        results: list[dict[str, Any]] = []
-        for adapter in self._platform_registry.get_enabled_platforms():
-            name = adapter.platform_name
-            try:
-                valid = await adapter.validate_credentials()
-                results.append({
-                    "name": f"platform:{name}",
-                    "status": "ok" if valid else "fail",
-                    "message": (
-                        f"{name} credentials valid"
-                        if valid
-                        else f"{name} credentials invalid"
-                    ),
-                })
-            except Exception as exc:
-                results.append({
-                    "name": f"platform:{name}",
-                    "status": "fail",
-                    "message": f"{name} check error: {exc}",
-                })
-        return results
+        # Credential checks are remote calls; wait for the slowest, not the sum.
+        return list(await asyncio.gather(*(
+            self._check_platform(adapter)
+            for adapter in self._platform_registry.get_enabled_platforms()
+        )))
+
+    async def _check_platform(self, adapter: PlatformAdapter) -> dict[str, Any]:
+        name = adapter.platform_name
+        try:
+            valid = await adapter.validate_credentials()
+            return {
+                "name": f"platform:{name}",
+                "status": "ok" if valid else "fail",
+                "message": (
+                    f"{name} credentials valid"
+                    if valid
+                    else f"{name} credentials invalid"
+                ),
+            }
+        except Exception as exc:
+            return {
+                "name": f"platform:{name}",
+                "status": "fail",
+                "message": f"{name} check error: {exc}",
+            }
 
     def _check_disk(self) -> dict[str, Any]:
         try:
@@ -341,6 +341,18 @@ class MissionService:
         await self._repo.update_status(mission_id, MissionStatus.CANCELLED)
         logger.info("Mission #%d cancelled", mission_id)
 
+    async def try_cancel(self, mission_id: int) -> tuple[bool, str | None]:
+        """Cancel a mission unless it has already finished.
+
+        Returns ``(True, "cancelled")`` on success, otherwise ``(False,
+        status)`` with the current status, or ``(False, None)`` if the
+        mission does not exist.
+        """
+        if await self._repo.close_if_open(mission_id, MissionStatus.CANCELLED):
+            logger.info("Mission #%d cancelled", mission_id)
+            return True, MissionStatus.CANCELLED.value
+        return False, await self._repo.get_status(mission_id)
+
     # ------------------------------------------------------------------
     # Query helpers
     # ------------------------------------------------------------------
@@ -359,6 +371,11 @@ class MissionService:
     ) -> list[Mission]:
         return await self._repo.get_all(limit, offset)
 
+    async def get_missions_page(
+        self, limit: int = 50, offset: int = 0, status: str | None = None
+    ) -> tuple[list[Mission], int]:
+        return await self._repo.get_page(limit, offset, status)
+
     async def count_missions(self) -> int:
         return await self._repo.count()
 
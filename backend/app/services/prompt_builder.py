@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from app.core.config import Config
+from app.core.config import Config, PersonalityConfig
 from app.core.constants import EMBEDDING_CANDIDATE_FETCH_LIMIT, MIN_COMMENT_LENGTH
 from app.core.logging import get_logger
 from app.core.security import SecurityFilter
@@ -35,6 +35,8 @@ class PromptBuilder:
         self._security = security_filter
         self._example_repo: GoodExampleRepository | None = None
         self._embedding: EmbeddingService | None = None
+        # (personality section, bot name, rendered prompt)
+        self._system_prompt_cache: tuple[PersonalityConfig, str, str] | None = None
 
     def set_example_repo(self, repo: GoodExampleRepository) -> None:
         """Inject good example repository for few-shot context."""
@@ -57,6 +59,18 @@ class PromptBuilder:
         p = self._config.personality
         bot_name = self._config.bot.name
 
+        # Sections are replaced (not mutated) on update, so the personality
+        # object's identity plus the bot name identify the inputs.
+        cached = self._system_prompt_cache
+        if cached is not None and cached[0] is p and cached[1] == bot_name:
+            return cached[2]
+
+        prompt = self._render_system_prompt(p, bot_name)
+        self._system_prompt_cache = (p, bot_name, prompt)
+        return prompt
+
+    @staticmethod
+    def _render_system_prompt(p: PersonalityConfig, bot_name: str) -> str:
         if p.system_prompt.strip():
             return p.system_prompt.strip()
 
@@ -208,6 +208,7 @@ export interface BookmarkToggleResponse {
 export interface BackupExportResponse {
   detail: string
   filename: string
+  sha256: string
   data: Record<string, unknown>
 }
 